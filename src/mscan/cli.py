@@ -1,10 +1,12 @@
 """CLI entry point for the Martech Scanner."""
 
 import json
+import threading
 import click
 from pathlib import Path
 from urllib.parse import urlparse
 from datetime import datetime
+from operator import itemgetter
 
 from rich.console import Console
 from rich.panel import Panel
@@ -13,10 +15,9 @@ from rich.status import Status
 from rich.table import Table
 from rich import box
 
-from mscan.scanner import scan_website_sync
-from mscan.fingerprints import match_vendors, match_vendors_extended, load_vendors, get_vendors_path, find_unknown_domains, get_all_categories
+from mscan.scanner import QUIET_SECONDS, scan_website_sync
+from mscan.fingerprints import match_vendors, scan_requests, load_vendors, get_vendors_path, get_all_categories, get_base_domain, warm_caches
 from mscan.report import generate_report
-from mscan.enricher import EdgarClient, ProfileBuilder
 
 # Competitive categories - these get special attention in takeaways
 COMPETITIVE_CATEGORIES = [
@@ -41,8 +42,6 @@ def extract_domain_name(url: str) -> str:
 
 def print_scan_summary(detected: list[dict], url: str, report_path: str, console: Console, enriched_brand=None):
     """Print an insightful summary of scan results with actionable takeaways."""
-    from mscan.models.enriched_brand import EnrichedBrand
-    
     domain = extract_domain_name(url)
     all_vendors = load_vendors()
     total_in_db = len(all_vendors)
@@ -51,9 +50,7 @@ def print_scan_summary(detected: list[dict], url: str, report_path: str, console
     by_category = {}
     for vendor in detected:
         cat = vendor['category']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(vendor)
+        by_category.setdefault(cat, []).append(vendor)
 
     # Build the summary text
     console.print()
@@ -74,11 +71,11 @@ def print_scan_summary(detected: list[dict], url: str, report_path: str, console
         console.print("  [dim]Site may use unlisted vendors or block tracking scripts.[/dim]")
     else:
         # Show findings by category (use dynamic category order from database)
-        category_order = get_all_categories()
+        category_order = get_all_categories(all_vendors)
 
         for cat in category_order:
-            if cat in by_category:
-                vendors = by_category[cat]
+            vendors = by_category.get(cat)
+            if vendors is not None:
                 vendor_names = [v['vendor_name'] for v in vendors]
                 count = len(vendors)
 
@@ -90,7 +87,7 @@ def print_scan_summary(detected: list[dict], url: str, report_path: str, console
 
         # Stats line
         console.print()
-        total_categories = len(get_all_categories())
+        total_categories = len(category_order)
         console.print(f"  [dim]{len(by_category)}/{total_categories} categories - {len(detected)}/{total_in_db} vendors[/dim]")
 
     # === TAKEAWAY ===
@@ -366,7 +363,7 @@ def add_vendors_batch(domains: list[dict], console: Console):
                             vendor['detection_rules']['domains'].append(new_domain)
                     break
 
-        data['vendors'].sort(key=lambda v: (v['category'], v['vendor_name']))
+        data['vendors'].sort(key=itemgetter('category', 'vendor_name'))
 
         with open(vendors_file, 'w') as f:
             json.dump(data, f, indent=2)
@@ -388,13 +385,14 @@ def cli():
 
 @cli.command()
 @click.argument('url')
-@click.option('--timeout', '-t', default=10, help='Seconds to wait for network activity per page')
+@click.option('--timeout', '-t', default=10, help='Maximum seconds to wait for network activity per page (ends early once the page goes quiet)')
+@click.option('--quiet-seconds', '-q', default=QUIET_SECONDS, help='Stop waiting on a page after this many seconds without new requests (0 waits the full --timeout)')
 @click.option('--pages', '-p', default=1, help='Maximum internal pages to scan beyond homepage')
 @click.option('--headless', is_flag=True, help='Run in headless mode (may be blocked by bot detection)')
 @click.option('--system-browser', '-s', is_flag=True, help='Use system Chromium (bypasses Akamai/bot detection)')
 @click.option('--show-report', '-r', is_flag=True, help='Display full report in terminal after scan')
 @click.option('--enrich', '-e', is_flag=True, help='Enrich with SEC EDGAR data if public company')
-def scan(url: str, timeout: int, pages: int, headless: bool, system_browser: bool, show_report: bool, enrich: bool):
+def scan(url: str, timeout: int, quiet_seconds: int, pages: int, headless: bool, system_browser: bool, show_report: bool, enrich: bool):
     """Scan a website for martech vendors.
 
     URL can be a domain (example.com) or full URL (https://example.com)
@@ -404,12 +402,18 @@ def scan(url: str, timeout: int, pages: int, headless: bool, system_browser: boo
     base_domain = extract_domain_name(url)
 
     console.print(f"[bold]Scanning {url}...[/bold]")
-    console.print(f"  Timeout: {timeout}s per page")
+    if quiet_seconds:
+        console.print(f"  Timeout: {timeout}s per page (or {quiet_seconds}s without new requests)")
+    else:
+        console.print(f"  Timeout: {timeout}s per page")
     console.print(f"  Max pages: {pages + 1} (homepage + {pages} internal)")
     if enrich:
         console.print(f"  [cyan]SEC enrichment enabled[/cyan]")
     console.print()
 
+    # Load the fingerprint databases while the browser works
+    threading.Thread(target=warm_caches, daemon=True).start()
+
     # Phase 1: Scan website with live status updates
     with console.status("[bold green]Starting scan...", spinner="dots") as status:
         def update_status(msg):
@@ -421,7 +425,8 @@ def scan(url: str, timeout: int, pages: int, headless: bool, system_browser: boo
             max_internal_pages=pages,
             headless=headless,
             system_browser=system_browser,
-            status_callback=update_status
+            status_callback=update_status,
+            quiet_seconds=quiet_seconds
         )
 
     pages_scanned = scan_results.get('pages_scanned', [])
@@ -429,17 +434,21 @@ def scan(url: str, timeout: int, pages: int, headless: bool, system_browser: boo
     console.print(f"[green]✓[/green] Scanned {len(pages_scanned)} pages, captured {len(requests)} network requests")
 
     # Phase 2: Match vendors (vendors.json + tracker_db.json fallback)
-    detected = match_vendors_extended(requests)
+    # Phase 3: Find unknown domains (same pass over the requests)
+    matches = scan_requests(requests, base_domain)
+    detected = matches['vendors']
     console.print(f"[green]✓[/green] Matched {len(detected)} vendors from database")
 
-    # Phase 3: Find unknown domains
-    unknown_domains = find_unknown_domains(requests, base_domain)
+    unknown_domains = matches['unknown']
     console.print(f"[green]✓[/green] Found {len(unknown_domains)} unknown third-party domains")
 
     # Phase 4: SEC Enrichment (if enabled)
     enriched_brand = None
     if enrich:
         console.print(f"[bold green]Enriching with SEC data...[/bold green]")
+        # Imported here so plain scans never load pydantic and the SEC client
+        from mscan.enricher import EdgarClient, ProfileBuilder
+
         try:
             user_agent = _get_user_agent()
             with EdgarClient(user_agent=user_agent) as client:
@@ -536,15 +545,14 @@ def list_vendors(category):
     by_category = {}
     for vendor in vendors:
         cat = vendor['category']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(vendor)
+        by_category.setdefault(cat, []).append(vendor)
 
     # Use dynamic category order from database
     category_order = get_all_categories()
 
     sorted_categories = [c for c in category_order if c in by_category]
-    sorted_categories += [c for c in by_category if c not in category_order]
+    known_categories = set(category_order)
+    sorted_categories += [c for c in by_category if c not in known_categories]
 
     console.print(f"\n[bold]Vendor Fingerprint Database[/bold] ({len(vendors)} vendors)\n")
 
@@ -554,7 +562,7 @@ def list_vendors(category):
         table.add_column("Domains", style="green", min_width=35)
         table.add_column("URL Patterns", style="yellow", min_width=20)
 
-        for vendor in sorted(by_category[cat], key=lambda v: v['vendor_name']):
+        for vendor in sorted(by_category[cat], key=itemgetter('vendor_name')):
             rules = vendor.get('detection_rules', {})
             domains = ', '.join(rules.get('domains', []))
             patterns = ', '.join(rules.get('url_patterns', [])) or '-'
@@ -568,7 +576,7 @@ def list_vendors(category):
 @click.argument('vendor_name')
 @click.option('--sample-url', '-s', required=True, help='URL of a website known to use this vendor')
 @click.option('--category', '-c', default=None, help='Vendor category (will prompt if not provided)')
-@click.option('--timeout', '-t', default=10, help='Seconds to wait for network activity')
+@click.option('--timeout', '-t', default=10, help='Maximum seconds to wait for network activity (ends early once the page goes quiet)')
 def add_vendor(vendor_name: str, sample_url: str, category: str, timeout: int):
     """Add a new vendor by discovering its fingerprint from a sample website.
 
@@ -617,11 +625,7 @@ def add_vendor(vendor_name: str, sample_url: str, category: str, timeout: int):
 
         # Count domain occurrences
         # Extract base domain (remove subdomains for grouping)
-        parts = domain.split('.')
-        if len(parts) >= 2:
-            base_domain = '.'.join(parts[-2:])
-        else:
-            base_domain = domain
+        base_domain = get_base_domain(domain)
 
         if base_domain not in domain_counts:
             domain_counts[base_domain] = {'count': 0, 'full_domains': set(), 'urls': []}
@@ -652,7 +656,7 @@ def add_vendor(vendor_name: str, sample_url: str, category: str, timeout: int):
         })
 
     # Sort by score
-    scored_domains.sort(key=lambda x: x['score'], reverse=True)
+    scored_domains.sort(key=itemgetter('score'), reverse=True)
 
     # Show top candidates
     console.print("[bold]Candidate domains (sorted by relevance):[/bold]\n")
@@ -755,7 +759,7 @@ def add_vendor(vendor_name: str, sample_url: str, category: str, timeout: int):
         data['vendors'].append(new_vendor)
 
         # Sort by category then name
-        data['vendors'].sort(key=lambda v: (v['category'], v['vendor_name']))
+        data['vendors'].sort(key=itemgetter('category', 'vendor_name'))
 
         with open(vendors_file, 'w') as f:
             json.dump(data, f, indent=2)
@@ -767,12 +771,13 @@ def add_vendor(vendor_name: str, sample_url: str, category: str, timeout: int):
 
 @cli.command('batch')
 @click.argument('file', type=click.Path(exists=True))
-@click.option('--timeout', '-t', default=10, help='Seconds to wait for network activity per page')
+@click.option('--timeout', '-t', default=10, help='Maximum seconds to wait for network activity per page (ends early once the page goes quiet)')
+@click.option('--quiet-seconds', '-q', default=QUIET_SECONDS, help='Stop waiting on a page after this many seconds without new requests (0 waits the full --timeout)')
 @click.option('--pages', '-p', default=1, help='Maximum internal pages to scan beyond homepage')
 @click.option('--headless', is_flag=True, help='Run in headless mode (may be blocked by bot detection)')
 @click.option('--system-browser', '-s', is_flag=True, help='Use system Chromium (bypasses Akamai/bot detection)')
 @click.option('--csv', 'csv_output', type=click.Path(), default=None, help='Export results to CSV file')
-def batch(file: str, timeout: int, pages: int, headless: bool, system_browser: bool, csv_output: str):
+def batch(file: str, timeout: int, quiet_seconds: int, pages: int, headless: bool, system_browser: bool, csv_output: str):
     """Batch scan multiple domains from a file.
 
     FILE can be a text file with one domain per line, or a CSV file.
@@ -820,6 +825,9 @@ def batch(file: str, timeout: int, pages: int, headless: bool, system_browser: b
     # Store results for each domain
     results = []
 
+    # Load the fingerprint databases while the first site is scanned
+    threading.Thread(target=warm_caches, daemon=True).start()
+
     # Scan each domain with progress
     with Progress(
         SpinnerColumn(),
@@ -843,24 +851,23 @@ def batch(file: str, timeout: int, pages: int, headless: bool, system_browser: b
                     max_internal_pages=pages,
                     headless=headless,
                     system_browser=system_browser,
-                    status_callback=None  # No status updates in batch mode
+                    status_callback=None,  # No status updates in batch mode
+                    quiet_seconds=quiet_seconds
                 )
 
                 requests = scan_results.get('requests', [])
 
                 # Match vendors (vendors.json + tracker_db.json fallback)
-                detected = match_vendors_extended(requests)
-
-                # Find unknown domains
-                unknown_domains = find_unknown_domains(requests, domain_name)
+                # and find unknown domains
+                matches = scan_requests(requests, domain_name)
+                detected = matches['vendors']
+                unknown_domains = matches['unknown']
 
                 # Group detected by category
                 by_category = {}
                 for vendor in detected:
                     cat = vendor['category']
-                    if cat not in by_category:
-                        by_category[cat] = []
-                    by_category[cat].append(vendor['vendor_name'])
+                    by_category.setdefault(cat, []).append(vendor['vendor_name'])
 
                 # Store result
                 results.append({
@@ -1089,7 +1096,7 @@ def manage_categories():
                             v['category'] = new_name
                             updated += 1
 
-                    data['vendors'].sort(key=lambda v: (v['category'], v['vendor_name']))
+                    data['vendors'].sort(key=itemgetter('category', 'vendor_name'))
 
                     with open(vendors_file, 'w') as f:
                         json.dump(data, f, indent=2)
@@ -1181,6 +1188,8 @@ def enrich(identifier: str, file: str, refresh: bool, output: str):
         identifiers = [identifier]
     
     # Initialize clients
+    from mscan.enricher import EdgarClient, ProfileBuilder
+
     user_agent = _get_user_agent()
     
     try:
@@ -1279,6 +1288,8 @@ def profile(identifier: str, refresh: bool):
     console = Console()
     console.print(f"[bold]Loading profile for:[/bold] [cyan]{identifier}[/cyan]\n")
     
+    from mscan.enricher import EdgarClient, ProfileBuilder
+
     user_agent = _get_user_agent()
     
     try:
@@ -1419,9 +1430,7 @@ def _display_profile(console: Console, brand):
         by_category = {}
         for tech in brand.detected_technologies:
             cat = tech.get('category', 'Unknown')
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(tech.get('vendor', 'Unknown'))
+            by_category.setdefault(cat, []).append(tech.get('vendor', 'Unknown'))
         
         tech_table = Table(show_header=True, header_style="bold")
         tech_table.add_column("Category", style="cyan")
@@ -1455,9 +1464,7 @@ def manage_vendors(category):
         by_category = {}
         for v in vendors:
             cat = v['category']
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(v)
+            by_category.setdefault(cat, []).append(v)
 
         categories = get_categories_from_db()
         sorted_cats = [c for c in categories if c in by_category]
@@ -1468,7 +1475,7 @@ def manage_vendors(category):
         vendor_list = []
         for cat in sorted_cats:
             console.print(f"[cyan]{cat}[/cyan]")
-            for v in sorted(by_category[cat], key=lambda x: x['vendor_name']):
+            for v in sorted(by_category[cat], key=itemgetter('vendor_name')):
                 vendor_list.append(v)
                 idx = len(vendor_list)
                 domains = v.get('detection_rules', {}).get('domains', [])
@@ -1510,7 +1517,7 @@ def manage_vendors(category):
                             v['vendor_name'] = new_name.strip()
                             break
 
-                    data['vendors'].sort(key=lambda v: (v['category'], v['vendor_name']))
+                    data['vendors'].sort(key=itemgetter('category', 'vendor_name'))
 
                     with open(vendors_file, 'w') as f:
                         json.dump(data, f, indent=2)
@@ -1542,7 +1549,7 @@ def manage_vendors(category):
                             v['category'] = new_cat
                             break
 
-                    data['vendors'].sort(key=lambda v: (v['category'], v['vendor_name']))
+                    data['vendors'].sort(key=itemgetter('category', 'vendor_name'))
 
                     with open(vendors_file, 'w') as f:
                         json.dump(data, f, indent=2)
@@ -7,10 +7,12 @@ and automatic cleanup of expired entries.
 import json
 import sqlite3
 import logging
+from collections import OrderedDict
+from threading import Lock, RLock
 from pathlib import Path
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from contextlib import contextmanager
 from enum import Enum
 
@@ -36,6 +38,18 @@ DEFAULT_TTL = {
 }
 
 
+# Connection tuning. WAL (enabled once in _init_db) lets readers proceed
+# while a write is in progress. The connection is kept open for the life of
+# the CacheManager, so mmap and the 64MB page cache stay warm across calls
+# and serve repeat reads from memory instead of read() syscalls.
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+"""
+
+
 @dataclass
 class CacheStats:
     """Cache performance statistics."""
@@ -78,11 +92,16 @@ class CacheManager:
     - Cache hit/miss tracking
     - Automatic cleanup of expired entries
     - JSON serialization for complex data types
+    - In-memory LRU of decoded entries, so repeat hits skip SQLite and JSON
     - Thread-safe operations
     
+    Data returned by get() may be shared with later calls and must be
+    treated as read-only.
+    
     Args:
         db_path: Path to SQLite database file. Default: ~/.mscan/edgar_cache.db
         ttl_overrides: Optional dict to override default TTL values.
+        memory_size: Maximum number of decoded entries kept in memory.
         
     Example:
         >>> cache = CacheManager()
@@ -95,7 +114,8 @@ class CacheManager:
     def __init__(
         self,
         db_path: str = "~/.mscan/edgar_cache.db",
-        ttl_overrides: Optional[Dict[CacheTier, int]] = None
+        ttl_overrides: Optional[Dict[CacheTier, int]] = None,
+        memory_size: int = 128
     ):
         self.db_path = Path(db_path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -108,6 +128,15 @@ class CacheManager:
         # In-memory stats (not persisted)
         self._stats = CacheStats()
         
+        # Decoded entries, most recently used last: key -> (expires_at, data)
+        self._memory: OrderedDict[str, Tuple[datetime, Dict[str, Any]]] = OrderedDict()
+        self._memory_size = memory_size
+        self._memory_lock = Lock()
+        
+        # One connection shared by all calls, opened on first use
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = RLock()
+        
         # Initialize database
         self._init_db()
         
@@ -116,6 +145,11 @@ class CacheManager:
     def _init_db(self):
         """Initialize SQLite schema with proper indexing."""
         with self._get_connection() as conn:
+            # Page size only takes effect before the first table is created;
+            # journal mode is persistent once set
+            conn.execute("PRAGMA page_size=4096")
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             # Main cache table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS edgar_cache (
@@ -160,19 +194,34 @@ class CacheManager:
                 INSERT OR IGNORE INTO cache_stats (id) VALUES (1)
             """)
             
-            conn.commit()
-            
         logger.debug("Database schema initialized")
     
     @contextmanager
     def _get_connection(self):
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Get the tuned, autocommit database connection with row factory.
+        
+        The connection is opened once and reused, so its page cache and
+        memory map persist between calls. Callers hold it exclusively for
+        the duration of the block, which makes it safe to share between
+        threads. Statements commit individually, so no explicit commit()
+        is needed.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                conn = sqlite3.connect(
+                    self.db_path, isolation_level=None, check_same_thread=False
+                )
+                conn.row_factory = sqlite3.Row
+                conn.executescript(CONNECTION_PRAGMAS)
+                self._conn = conn
+            yield self._conn
+    
+    def close(self):
+        """Close the database connection; it is reopened on next use."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
     def get(
         self,
@@ -189,6 +238,14 @@ class CacheManager:
         Returns:
             Cached data dict if found and not expired, None otherwise.
         """
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None and (not check_expiry or entry[0] > datetime.now()):
+                self._memory.move_to_end(key)
+                self._stats.hits += 1
+                logger.debug(f"Memory cache hit for key: {key}")
+                return entry[1]
+        
         try:
             with self._get_connection() as conn:
                 if check_expiry:
@@ -216,11 +273,12 @@ class CacheManager:
                         """,
                         (row['access_count'] + 1, key)
                     )
-                    conn.commit()
                     
                     self._stats.hits += 1
                     logger.debug(f"Cache hit for key: {key}")
-                    return json.loads(row['data'])
+                    data = json.loads(row['data'])
+                    self._remember(key, data, datetime.fromisoformat(row['expires_at']))
+                    return data
                 else:
                     self._stats.misses += 1
                     logger.debug(f"Cache miss for key: {key}")
@@ -274,8 +332,8 @@ class CacheManager:
                         expires_at.isoformat()
                     )
                 )
-                conn.commit()
                 
+            self._remember(key, data, expires_at)
             self._stats.sets += 1
             logger.debug(f"Cached data for key: {key} (expires: {expires_at})")
             return True
@@ -285,6 +343,22 @@ class CacheManager:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    def _remember(self, key: str, data: Dict[str, Any], expires_at: datetime):
+        """Keep a decoded entry in the in-memory LRU, evicting the oldest."""
+        with self._memory_lock:
+            self._memory[key] = (expires_at, data)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+    
+    def _forget(self, key: Optional[str] = None):
+        """Drop one entry (or all entries) from the in-memory LRU."""
+        with self._memory_lock:
+            if key is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(key, None)
+    
     def delete(self, key: str) -> bool:
         """Delete a specific cache entry.
         
@@ -294,13 +368,13 @@ class CacheManager:
         Returns:
             True if entry existed and was deleted, False otherwise.
         """
+        self._forget(key)
         try:
             with self._get_connection() as conn:
                 cursor = conn.execute(
                     "DELETE FROM edgar_cache WHERE key = ?",
                     (key,)
                 )
-                conn.commit()
                 
                 if cursor.rowcount > 0:
                     self._stats.deletes += 1
@@ -319,12 +393,12 @@ class CacheManager:
         Returns:
             Number of entries removed.
         """
+        self._forget()
         try:
             with self._get_connection() as conn:
                 cursor = conn.execute(
                     "DELETE FROM edgar_cache WHERE expires_at <= datetime('now')"
                 )
-                conn.commit()
                 
                 removed = cursor.rowcount
                 if removed > 0:
@@ -335,7 +409,6 @@ class CacheManager:
                 conn.execute(
                     "UPDATE cache_stats SET last_cleanup = datetime('now') WHERE id = 1"
                 )
-                conn.commit()
                 
                 return removed
                 
@@ -467,13 +540,13 @@ class CacheManager:
         Returns:
             True if successful, False otherwise.
         """
+        self._forget()
         try:
             with self._get_connection() as conn:
                 conn.execute("DELETE FROM edgar_cache")
                 conn.execute(
                     "UPDATE cache_stats SET persisted_hits = 0, persisted_misses = 0 WHERE id = 1"
                 )
-                conn.commit()
                 
             logger.info("Cache cleared")
             self._stats = CacheStats()
@@ -496,7 +569,6 @@ class CacheManager:
                     """,
                     (self._stats.hits, self._stats.misses)
                 )
-                conn.commit()
                 
             # Reset in-memory counters
             self._stats.hits = 0
@@ -510,5 +582,6 @@ class CacheManager:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - persist stats."""
+        """Context manager exit - persist stats and close the connection."""
         self.persist_stats()
+        self.close()
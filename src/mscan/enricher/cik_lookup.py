@@ -10,7 +10,7 @@ Provides functionality to:
 import re
 import json
 import logging
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from difflib import SequenceMatcher, get_close_matches
 from dataclasses import dataclass
 
@@ -56,10 +56,14 @@ class CIKLookup:
     Args:
         cache_manager: CacheManager instance for storing ticker mappings.
         rate_limiter: RateLimiter instance for API requests.
-        user_agent: User-Agent string required by SEC.
+        session: Shared requests.Session carrying the SEC User-Agent header.
+                 A User-Agent string is also accepted, in which case a
+                 private session is created for it.
         
     Example:
-        >>> lookup = CIKLookup(cache_manager, rate_limiter, "YourCo contact@you.com")
+        >>> session = requests.Session()
+        >>> session.headers["User-Agent"] = "YourCo contact@you.com"
+        >>> lookup = CIKLookup(cache_manager, rate_limiter, session)
         >>> cik = lookup.by_ticker("AAPL")
         >>> matches = lookup.by_name("Apple Inc", limit=3)
     """
@@ -71,12 +75,18 @@ class CIKLookup:
         self,
         cache_manager: CacheManager,
         rate_limiter: RateLimiter,
-        user_agent: str
+        session: Union[requests.Session, str]
     ):
+        if isinstance(session, str):
+            user_agent = session
+            session = requests.Session()
+            session.headers["User-Agent"] = user_agent
+        
         self.cache = cache_manager
         self.rate_limiter = rate_limiter
-        self.user_agent = user_agent
-        self.headers = {"User-Agent": user_agent}
+        self.session = session
+        self.user_agent = session.headers.get("User-Agent")
+        self.headers = session.headers
         
         # In-memory cache of ticker mappings
         self._ticker_to_cik: Dict[str, str] = {}
@@ -119,11 +129,7 @@ class CIKLookup:
             logger.info("Fetching ticker mapping from SEC...")
             self.rate_limiter.acquire()
             
-            response = requests.get(
-                self.TICKER_URL,
-                headers=self.headers,
-                timeout=30
-            )
+            response = self.session.get(self.TICKER_URL, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -558,6 +564,17 @@ class CIKLookup:
         
         return matches
     
+    def ensure_loaded(self) -> bool:
+        """Load the ticker mapping now if it is not loaded yet.
+        
+        Lookups load the mapping lazily on first use; call this before
+        fanning lookups out over threads so they do not all race to fetch it.
+        
+        Returns:
+            True if the mapping is loaded, False otherwise.
+        """
+        return self._load_mapping()
+    
     def refresh_mapping(self) -> bool:
         """Force refresh of ticker mapping from SEC.
         
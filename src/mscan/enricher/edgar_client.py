@@ -17,12 +17,23 @@ Usage:
     
     # Enrich by CIK directly
     result = client.enrich_by_cik("0000320193")
+    
+    # Enrich many tickers concurrently
+    results = client.enrich_batch(["AAPL", "MSFT", "NKE"])
 """
 
+import re
+import copy
 import json
 import time
+import heapq
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+from collections import Counter, OrderedDict
+from itertools import zip_longest
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Set, Tuple, Callable
 from datetime import datetime
 from pathlib import Path
 
@@ -30,7 +41,7 @@ import requests
 import backoff
 
 from mscan.utils.rate_limiter import RateLimiter
-from mscan.enricher.cache_manager import CacheManager, CacheTier
+from mscan.enricher.cache_manager import CacheManager, CacheTier, DEFAULT_TTL
 from mscan.enricher.cik_lookup import CIKLookup, TickerNotFoundError, CompanyNotFoundError
 from mscan.models.enriched_brand import (
     SECProfile,
@@ -44,6 +55,21 @@ from mscan.models.enriched_brand import (
 
 logger = logging.getLogger(__name__)
 
+# Sort key for XBRL fact entries by period end date
+_END = itemgetter('end')
+
+# Successful ticker enrichments kept in memory per client (least recently
+# used evicted first)
+_RESULT_CACHE_SIZE = 1024
+
+# SEC User-Agent format: "CompanyName contact@company.com"
+_USER_AGENT_RE = re.compile(r"^\S.*\s\S+@[^\s@]+\.[^\s@]+")
+
+
+def _pad_cik(cik: str) -> str:
+    """Zero-pad a CIK to 10 digits, skipping the copy if already canonical."""
+    return cik if len(cik) == 10 else cik.zfill(10)
+
 
 class EdgarAPIException(Exception):
     """Base exception for EDGAR API errors."""
@@ -86,6 +112,9 @@ class EdgarClient:
                    Format: "CompanyName ContactEmail@company.com"
         cache_dir: Directory for SQLite cache. Default: ~/.mscan/
         max_retries: Maximum number of retries for failed requests.
+        session: Optional requests.Session to send requests through. One is
+                 created if omitted. The same session is shared with the
+                 CIK lookup so all SEC requests reuse its connection pool.
         
     Raises:
         ValueError: If user_agent is invalid or missing contact email.
@@ -102,16 +131,32 @@ class EdgarClient:
     COMPANY_FACTS_ENDPOINT = "/api/xbrl/companyfacts/CIK{cik}.json"
     COMPANY_CONCEPT_ENDPOINT = "/api/xbrl/companyconcept/CIK{cik}/{taxonomy}/{tag}.json"
     
+    # XBRL tags read by extract_financial_metrics()
+    REVENUE_TAGS = [
+        'Revenues',
+        'RevenueFromContractWithCustomerExcludingAssessedTax',
+        'SalesRevenueNet',
+        'TotalRevenues'
+    ]
+    SGA_TAGS = ['SellingGeneralAndAdministrativeExpense', 'SellingAndMarketingExpense']
+    FACTS_TAGS = frozenset(REVENUE_TAGS + SGA_TAGS + [
+        'NetIncomeLoss',
+        'Assets',
+        'ResearchAndDevelopmentExpense',
+        'EntityNumberOfEmployees',
+    ])
+    
     def __init__(
         self,
         user_agent: str,
         cache_dir: str = "~/.mscan",
-        max_retries: int = 3
+        max_retries: int = 3,
+        session: Optional[requests.Session] = None
     ):
         # Validate user agent per SEC requirements
         if not user_agent:
             raise ValueError("User-Agent is required per SEC guidelines")
-        if "@" not in user_agent:
+        if not _USER_AGENT_RE.match(user_agent):
             raise ValueError(
                 "User-Agent must include contact email per SEC guidelines. "
                 "Format: 'CompanyName contact@company.com'"
@@ -121,24 +166,82 @@ class EdgarClient:
         self.headers = {"User-Agent": user_agent}
         self.max_retries = max_retries
         
+        # One keep-alive connection pool for every SEC request
+        self.session = session if session is not None else requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Endpoint URLs have a single {cik} substitution, so split them once
+        # and build each URL by concatenation instead of str.format()
+        prefix, _, self._submissions_suffix = self.SUBMISSIONS_ENDPOINT.partition("{cik}")
+        self._submissions_prefix = self.BASE_URL + prefix
+        prefix, _, self._facts_suffix = self.COMPANY_FACTS_ENDPOINT.partition("{cik}")
+        self._facts_prefix = self.BASE_URL + prefix
+        
         # Initialize components
         self.rate_limiter = RateLimiter(max_requests=10, window_seconds=1)
         self.cache = CacheManager(db_path=f"{cache_dir}/edgar_cache.db")
-        self.cik_lookup = CIKLookup(self.cache, self.rate_limiter, user_agent)
+        self.cik_lookup = CIKLookup(self.cache, self.rate_limiter, self.session)
         
-        # Request tracking
-        self._request_count = 0
-        self._cache_hit_count = 0
+        # Request tracking (per thread, so concurrent enrichments don't mix counts)
+        self._local = threading.local()
+        
+        # Successful enrichments by ticker: ticker -> (expires_at, result), in
+        # LRU order. enrich_batch() calls in from worker threads, hence the lock.
+        self._result_cache: "OrderedDict[str, Tuple[float, EnrichmentResult]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._result_ttl = DEFAULT_TTL[CacheTier.ENTITY_METADATA]
         
         logger.info(f"EdgarClient initialized with user_agent: {user_agent[:30]}...")
     
+    @classmethod
+    def with_shared_session(
+        cls,
+        session: requests.Session,
+        user_agent: Optional[str] = None,
+        **kwargs
+    ) -> "EdgarClient":
+        """Create a client that reuses an existing requests.Session.
+        
+        Use this when building several clients in one process so they share
+        keep-alive connections instead of each opening their own.
+        
+        Args:
+            session: Session to send all requests through.
+            user_agent: User-Agent string. Defaults to the one already set
+                       on the session.
+            **kwargs: Remaining EdgarClient constructor arguments.
+            
+        Returns:
+            EdgarClient bound to the given session.
+        """
+        if user_agent is None:
+            user_agent = session.headers.get("User-Agent", "")
+        return cls(user_agent=user_agent, session=session, **kwargs)
+    
+    @property
+    def _request_count(self) -> int:
+        return getattr(self._local, 'request_count', 0)
+    
+    @_request_count.setter
+    def _request_count(self, value: int):
+        self._local.request_count = value
+    
+    @property
+    def _cache_hit_count(self) -> int:
+        return getattr(self._local, 'cache_hit_count', 0)
+    
+    @_cache_hit_count.setter
+    def _cache_hit_count(self, value: int):
+        self._local.cache_hit_count = value
+    
     def _make_request(
         self,
         url: str,
         method: str = "GET",
         use_cache: bool = True,
         cache_key: Optional[str] = None,
-        cache_tier: CacheTier = CacheTier.ENTITY_METADATA
+        cache_tier: CacheTier = CacheTier.ENTITY_METADATA,
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Make a rate-limited API request with retry logic.
         
@@ -148,6 +251,8 @@ class EdgarClient:
             use_cache: Whether to check cache before making request.
             cache_key: Cache key for storing response. Uses URL if None.
             cache_tier: Cache tier for TTL determination.
+            transform: Optional function applied to the decoded response
+                      before it is cached and returned.
             
         Returns:
             Parsed JSON response as dict.
@@ -182,11 +287,7 @@ class EdgarClient:
         def _do_request():
             logger.debug(f"API request: {url}")
             try:
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    timeout=30
-                )
+                response = self.session.get(url, timeout=30)
                 
                 # Handle specific status codes
                 if response.status_code == 403:
@@ -227,13 +328,18 @@ class EdgarClient:
         data = _do_request()
         self._request_count += 1
         
+        if transform is not None:
+            data = transform(data)
+        
         # Cache the response
         if use_cache:
+            tickers = data.get('tickers')
+            ticker = tickers[0] if isinstance(tickers, list) and tickers else None
             self.cache.set(
                 cache_key,
                 data,
                 tier=cache_tier,
-                ticker=data.get('tickers', [None])[0] if isinstance(data.get('tickers'), list) else None,
+                ticker=ticker,
                 company_name=data.get('entityName')
             )
         
@@ -257,8 +363,8 @@ class EdgarClient:
             NotFoundError: If CIK not found.
             EdgarAPIException: For API errors.
         """
-        cik = cik.zfill(10)
-        url = f"{self.BASE_URL}{self.SUBMISSIONS_ENDPOINT.format(cik=cik)}"
+        cik = _pad_cik(cik)
+        url = self._submissions_prefix + cik + self._submissions_suffix
         
         data = self._make_request(
             url,
@@ -291,25 +397,28 @@ class EdgarClient:
         """Parse filings metadata from submissions response."""
         filings = data.get('filings', {}).get('recent', {})
         
-        recent_filings = []
         forms = filings.get('form', [])
         dates = filings.get('filingDate', [])
         acc_nums = filings.get('accessionNumber', [])
         docs = filings.get('primaryDocument', [])
         
-        for i in range(min(len(forms), 20)):  # Last 20 filings
-            if i < len(forms):
-                recent_filings.append(Filing(
-                    accession_number=acc_nums[i] if i < len(acc_nums) else '',
-                    filing_date=dates[i] if i < len(dates) else '',
-                    form_type=forms[i],
-                    primary_document=docs[i] if i < len(docs) else None
-                ))
+        # Last 20 filings; the parallel lists may be shorter than 'form'
+        n = min(len(forms), 20)
+        recent_filings = [
+            Filing(
+                accession_number=acc if acc is not None else '',
+                filing_date=date if date is not None else '',
+                form_type=form,
+                primary_document=doc
+            )
+            for form, acc, date, doc in zip_longest(forms[:n], acc_nums[:n], dates[:n], docs[:n])
+        ]
         
-        # Count by type
-        count_10k = sum(1 for f in forms if f == '10-K')
-        count_10q = sum(1 for f in forms if f == '10-Q')
-        count_8k = sum(1 for f in forms if f == '8-K')
+        # Count by type in a single pass
+        form_counts = Counter(forms)
+        count_10k = form_counts['10-K']
+        count_10q = form_counts['10-Q']
+        count_8k = form_counts['8-K']
         
         last_date = dates[0] if dates else None
         
@@ -324,36 +433,64 @@ class EdgarClient:
     def get_company_facts(
         self,
         cik: str,
-        use_cache: bool = True
+        use_cache: bool = True,
+        tags: Optional[Set[str]] = None
     ) -> Dict[str, Any]:
-        """Get all XBRL company facts.
+        """Get XBRL company facts, projected to the requested tags.
+        
+        The full companyfacts document holds thousands of tags (often 20+MB)
+        while only a handful are needed, so the response is reduced to the
+        requested tags before it is cached and returned.
         
         Args:
             cik: CIK number (will be zero-padded).
             use_cache: Whether to use cached data.
+            tags: XBRL tags to keep. Defaults to FACTS_TAGS, the tags read
+                  by extract_financial_metrics().
             
         Returns:
-            Raw company facts data dict.
+            Company facts dict in the companyfacts shape, containing only
+            the requested tags.
             
         Raises:
             NotFoundError: If CIK not found.
             EdgarAPIException: For API errors.
         """
-        cik = cik.zfill(10)
-        url = f"{self.BASE_URL}{self.COMPANY_FACTS_ENDPOINT.format(cik=cik)}"
+        cik = _pad_cik(cik)
+        url = self._facts_prefix + cik + self._facts_suffix
+        
+        if tags is None:
+            tags = self.FACTS_TAGS
+            cache_key = f"facts:{cik}"
+        else:
+            cache_key = f"facts:{cik}:{','.join(sorted(tags))}"
         
         return self._make_request(
             url,
             use_cache=use_cache,
-            cache_key=f"facts:{cik}",
-            cache_tier=CacheTier.COMPANY_FACTS
+            cache_key=cache_key,
+            cache_tier=CacheTier.COMPANY_FACTS,
+            transform=lambda data: self._project_facts(data, tags)
         )
     
+    @staticmethod
+    def _project_facts(data: Dict[str, Any], tags: Set[str]) -> Dict[str, Any]:
+        """Reduce a companyfacts response to the given tags."""
+        facts = data.get('facts', {})
+        return {
+            'cik': data.get('cik'),
+            'entityName': data.get('entityName'),
+            'facts': {
+                taxonomy: {tag: values for tag, values in taxonomy_facts.items() if tag in tags}
+                for taxonomy, taxonomy_facts in facts.items()
+            }
+        }
+    
     def extract_financial_metrics(self, facts: Dict[str, Any]) -> FinancialMetrics:
         """Extract key financial metrics from company facts.
         
         Args:
-            facts: Raw company facts data from get_company_facts().
+            facts: Company facts data from get_company_facts().
             
         Returns:
             FinancialMetrics with extracted values.
@@ -368,20 +505,14 @@ class EdgarClient:
             for tag in tags:
                 if tag in data_dict:
                     units = data_dict[tag].get('units', {}).get(unit, [])
-                    annual = [u for u in units if u.get('fp') == 'FY']
+                    annual = [u for u in units if u.get('fp') == 'FY' and 'end' in u]
                     if annual:
-                        latest = max(annual, key=lambda x: x.get('end', ''))
+                        latest = max(annual, key=_END)
                         return latest, annual
             return None, []
         
         # Revenue
-        revenue_tags = [
-            'Revenues',
-            'RevenueFromContractWithCustomerExcludingAssessedTax',
-            'SalesRevenueNet',
-            'TotalRevenues'
-        ]
-        rev_data, rev_history = get_latest_annual(us_gaap, revenue_tags)
+        rev_data, rev_history = get_latest_annual(us_gaap, self.REVENUE_TAGS)
         if rev_data:
             metrics.revenue_usd = rev_data.get('val')
             metrics.fiscal_year = str(rev_data.get('fy', ''))
@@ -389,9 +520,9 @@ class EdgarClient:
             
             # Calculate YoY growth
             if len(rev_history) >= 2:
-                sorted_hist = sorted(rev_history, key=lambda x: x.get('end', ''), reverse=True)
-                current = sorted_hist[0]['val']
-                previous = sorted_hist[1]['val']
+                latest_two = heapq.nlargest(2, rev_history, key=_END)
+                current = latest_two[0]['val']
+                previous = latest_two[1]['val']
                 if previous and previous > 0:
                     metrics.revenue_growth_yoy = round((current - previous) / previous * 100, 2)
         
@@ -407,14 +538,13 @@ class EdgarClient:
         
         # Employee Count (from dei namespace, shares unit)
         if 'EntityNumberOfEmployees' in dei:
-            units = dei['EntityNumberOfEmployees'].get('units', {}).get('shares', [])
+            units = [u for u in dei['EntityNumberOfEmployees'].get('units', {}).get('shares', []) if 'end' in u]
             if units:
-                latest = max(units, key=lambda x: x.get('end', ''))
+                latest = max(units, key=_END)
                 metrics.employee_count = int(latest.get('val', 0))
         
         # Marketing/SG&A Expense
-        sga_tags = ['SellingGeneralAndAdministrativeExpense', 'SellingAndMarketingExpense']
-        sga_data, _ = get_latest_annual(us_gaap, sga_tags)
+        sga_data, _ = get_latest_annual(us_gaap, self.SGA_TAGS)
         if sga_data:
             metrics.marketing_spend_usd = sga_data.get('val')
         
@@ -440,7 +570,8 @@ class EdgarClient:
             EnrichmentResult with profile or error information.
         """
         start_time = time.time()
-        cik = cik.zfill(10)
+        enriched_at = datetime.fromtimestamp(start_time)
+        cik = _pad_cik(cik)
         
         self._request_count = 0
         self._cache_hit_count = 0
@@ -465,8 +596,8 @@ class EdgarClient:
             except Exception as e:
                 logger.warning(f"Failed to extract financials for CIK {cik}: {e}")
             
-            # Build SEC profile
-            profile = SECProfile(
+            # Build SEC profile; every field comes from models validated above
+            profile = SECProfile.from_trusted(
                 cik=cik,
                 ticker=ticker,
                 company_name=entity_meta.entity_name,
@@ -478,12 +609,12 @@ class EdgarClient:
                 latest_financials=financials,
                 filings_metadata=filings_meta,
                 last_filing_date=filings_meta.last_filing_date,
-                enriched_at=datetime.now(),
+                enriched_at=enriched_at,
             )
             
             from mscan.models.enriched_brand import EnrichedBrand
             
-            brand = EnrichedBrand(
+            brand = EnrichedBrand.from_trusted(
                 domain="",  # Will be set by caller if known
                 is_publicly_traded=True,
                 sec_profile=profile,
@@ -542,6 +673,27 @@ class EdgarClient:
             EnrichmentResult with profile or error information.
         """
         ticker = ticker.upper().strip()
+        
+        # Repeat lookups in this session skip CIK resolution, decoding and extraction
+        with self._result_cache_lock:
+            cached = self._result_cache.get(ticker)
+            if cached is not None:
+                if time.monotonic() < cached[0]:
+                    self._result_cache.move_to_end(ticker)
+                else:
+                    self._result_cache.pop(ticker, None)
+                    cached = None
+        if cached is not None:
+            logger.debug(f"Result cache hit for ticker: {ticker}")
+            self._cache_hit_count += 1
+            # Callers mutate the brand (e.g. ProfileBuilder), so hand out a copy.
+            # The counters describe this call, which made no API requests.
+            result = copy.deepcopy(cached[1])
+            result.api_calls_made = 0
+            result.cache_hits = 1
+            result.duration_seconds = 0.0
+            return result
+        
         logger.info(f"Enriching by ticker: {ticker}")
         
         try:
@@ -553,6 +705,14 @@ class EdgarClient:
                 # Domain lookup would go here in Phase 2
                 pass
             
+            if result.success:
+                entry = (time.monotonic() + self._result_ttl, copy.deepcopy(result))
+                with self._result_cache_lock:
+                    self._result_cache[ticker] = entry
+                    self._result_cache.move_to_end(ticker)
+                    if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            
             return result
             
         except TickerNotFoundError as e:
@@ -575,6 +735,33 @@ class EdgarClient:
                 )
             )
     
+    def enrich_batch(
+        self,
+        tickers: List[str],
+        max_workers: int = 10
+    ) -> List[EnrichmentResult]:
+        """Enrich many companies by ticker concurrently.
+        
+        Requests are fanned out over a thread pool so that SEC response
+        latency overlaps instead of accumulating. The shared rate limiter
+        still caps the overall request rate at the SEC limit.
+        
+        Args:
+            tickers: Stock ticker symbols to enrich.
+            max_workers: Maximum number of concurrent enrichments.
+            
+        Returns:
+            List of EnrichmentResult in the same order as tickers.
+        """
+        if not tickers:
+            return []
+        
+        # Load the ticker mapping once up front rather than racing to fetch it
+        self.cik_lookup.ensure_loaded()
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+            return list(executor.map(self.enrich_by_ticker, tickers))
+    
     def enrich_by_name(
         self,
         name: str,
@@ -666,6 +853,8 @@ class EdgarClient:
     def clear_cache(self):
         """Clear all cached data."""
         self.cache.clear_all()
+        with self._result_cache_lock:
+            self._result_cache.clear()
         logger.info("Cache cleared")
     
     def refresh_ticker_mapping(self) -> bool:
@@ -679,6 +868,7 @@ class EdgarClient:
     def close(self):
         """Clean up resources and persist statistics."""
         self.cache.persist_stats()
+        self.cache.close()
         logger.info("EdgarClient closed")
     
     def __enter__(self):
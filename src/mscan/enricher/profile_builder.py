@@ -4,8 +4,12 @@ Combines mscan website scan data with SEC EDGAR enrichment to build
 comprehensive brand profiles with marketing insights and recommendations.
 """
 
+import re
 import logging
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, FrozenSet, Iterable, Sequence, Tuple
 from datetime import datetime
 
 from mscan.models.enriched_brand import (
@@ -17,6 +21,58 @@ from mscan.models.enriched_brand import (
 
 logger = logging.getLogger(__name__)
 
+_VENDOR_KEY = itemgetter('vendor_name', 'category')
+
+# Industry keyword -> recommendation, matched against the SIC description
+_INDUSTRY_RECOMMENDATIONS = {
+    'retail': "Retail focus - emphasize customer journey optimization",
+    'electronic': "Retail focus - emphasize customer journey optimization",
+    'software': "Tech company - technical buyers, emphasize integration",
+    'computer': "Tech company - technical buyers, emphasize integration",
+    'health': "Healthcare vertical - emphasize compliance and privacy",
+    'pharma': "Healthcare vertical - emphasize compliance and privacy",
+}
+_INDUSTRY_RE = re.compile('|'.join(_INDUSTRY_RECOMMENDATIONS))
+# Recommendations are emitted in this order regardless of match position
+_INDUSTRY_ORDER = tuple(dict.fromkeys(_INDUSTRY_RECOMMENDATIONS.values()))
+
+
+def _split_tiers(tiers: Sequence[Tuple[float, int]]) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """Split descending (threshold, points) tiers into ascending parallel tuples."""
+    ascending = sorted(tiers)
+    return tuple(t for t, _ in ascending), tuple(p for _, p in ascending)
+
+
+def _tiers_in_billions(tiers: Sequence[Tuple[float, int]]) -> Tuple[Tuple[float, int], ...]:
+    """Convert (threshold in USD, points) tiers to thresholds in billions USD."""
+    return tuple((threshold / 1_000_000_000, points) for threshold, points in tiers)
+
+
+def _tier_points(thresholds: Tuple[float, ...], points: Tuple[int, ...], value: float) -> int:
+    """Return the points of the highest tier whose threshold ``value`` reaches."""
+    idx = bisect_right(thresholds, value)
+    return points[idx - 1] if idx else 0
+
+
+def _normalize_vendors(vendors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert scan-format vendors into detected technology dicts."""
+    out = []
+    append = out.append
+    for v in vendors:
+        try:
+            name, category = _VENDOR_KEY(v)
+        except KeyError:
+            name, category = v.get('vendor_name', 'Unknown'), v.get('category', 'Unknown')
+        append({'vendor': name, 'category': category})
+    return out
+
+
+def _summarize_tech(detected: List[Dict[str, Any]]) -> Tuple[int, FrozenSet[str]]:
+    """Return the vendor count and the set of non-empty categories in one pass."""
+    return len(detected), frozenset(
+        cat for tech in detected if (cat := tech.get('category'))
+    )
+
 
 class ProfileBuilderError(Exception):
     """Base exception for profile builder errors."""
@@ -43,8 +99,10 @@ class ProfileBuilder:
         ... )
     """
     
-    # Revenue tiers for qualification scoring
-    REVENUE_TIERS = [
+    __slots__ = ('min_revenue_threshold', 'min_employee_threshold')
+    
+    # Revenue tiers for qualification scoring (USD)
+    REVENUE_TIERS = (
         (1_000_000_000_000, 100),  # $1T+ → 100 points
         (100_000_000_000, 90),     # $100B+ → 90 points
         (10_000_000_000, 80),      # $10B+ → 80 points
@@ -53,23 +111,69 @@ class ProfileBuilder:
         (100_000_000, 50),         # $100M+ → 50 points
         (10_000_000, 40),          # $10M+ → 40 points
         (1_000_000, 30),           # $1M+ → 30 points
-    ]
+    )
+    # The same tiers in billions USD, which is what scoring compares against
+    REVENUE_TIERS_B = _tiers_in_billions(REVENUE_TIERS)
     
     # Employee count tiers
-    EMPLOYEE_TIERS = [
+    EMPLOYEE_TIERS = (
         (100_000, 25),   # 100K+ → 25 points
         (10_000, 20),    # 10K+ → 20 points
         (1_000, 15),     # 1K+ → 15 points
         (100, 10),       # 100+ → 10 points
-    ]
+    )
     
     # Marketing spend tiers (as % of revenue)
-    MARKETING_SPEND_TIERS = [
+    MARKETING_SPEND_TIERS = (
         (0.20, 20),  # 20%+ of revenue → 20 points
         (0.10, 15),  # 10%+ → 15 points
         (0.05, 10),  # 5%+ → 10 points
         (0.02, 5),   # 2%+ → 5 points
-    ]
+    )
+    
+    # Insight rules: (threshold, template), checked in order, first match wins
+    REVENUE_INSIGHT_RULES = (
+        (100, "Fortune 100 company with ${:.0f}B revenue"),   # in billions
+        (10, "Large enterprise with ${:.1f}B revenue"),
+        (1, "Mid-market company with ${:.1f}B revenue"),
+    )
+    GROWTH_INSIGHT_RULES = (
+        (20, "High growth: {:.1f}% YoY revenue growth"),      # strictly above
+        (10, "Strong growth: {:.1f}% YoY revenue growth"),
+    )
+    EMPLOYEE_INSIGHT_RULES = (
+        (100_000, "Major employer with {:,} employees"),
+        (10_000, "Large organization with {:,} employees"),
+        (1_000, "Growing team: {:,} employees"),
+    )
+    RD_INSIGHT_RULES = (
+        (10, "Heavy R&D investment: ${:.0f}M ({:.1f}% of revenue)"),  # % of revenue
+        (5, "Moderate R&D spend: ${:.0f}M ({:.1f}% of revenue)"),
+    )
+    
+    # Size-based recommendations: (minimum revenue in billions, recommendations)
+    SIZE_RECOMMENDATION_RULES = (
+        (10, ("Enterprise-grade solutions appropriate",
+              "Multi-stakeholder sales approach recommended")),
+        (1, ("Mid-market/enterprise hybrid approach",
+             "Emphasize scalability and ROI")),
+    )
+    GROWTH_RECOMMENDATIONS = ("Growth-focused value proposition",
+                              "Emphasize quick time-to-value")
+    
+    # Ascending thresholds/points for binary search over the tiers above.
+    # Rebuilt for each subclass, so overriding a tier table takes effect.
+    _REVENUE_THRESHOLDS, _REVENUE_POINTS = _split_tiers(REVENUE_TIERS_B)
+    _EMPLOYEE_THRESHOLDS, _EMPLOYEE_POINTS = _split_tiers(EMPLOYEE_TIERS)
+    _MARKETING_THRESHOLDS, _MARKETING_POINTS = _split_tiers(MARKETING_SPEND_TIERS)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'REVENUE_TIERS' in cls.__dict__ and 'REVENUE_TIERS_B' not in cls.__dict__:
+            cls.REVENUE_TIERS_B = _tiers_in_billions(cls.REVENUE_TIERS)
+        cls._REVENUE_THRESHOLDS, cls._REVENUE_POINTS = _split_tiers(cls.REVENUE_TIERS_B)
+        cls._EMPLOYEE_THRESHOLDS, cls._EMPLOYEE_POINTS = _split_tiers(cls.EMPLOYEE_TIERS)
+        cls._MARKETING_THRESHOLDS, cls._MARKETING_POINTS = _split_tiers(cls.MARKETING_SPEND_TIERS)
     
     def __init__(
         self,
@@ -103,11 +207,7 @@ class ProfileBuilder:
         detected_technologies = scan_data.get('detected_technologies', [])
         if not detected_technologies and 'vendors' in scan_data:
             # Convert from scan format
-            detected_technologies = [
-                {'vendor': v.get('vendor_name', 'Unknown'), 
-                 'category': v.get('category', 'Unknown')}
-                for v in scan_data.get('vendors', [])
-            ]
+            detected_technologies = _normalize_vendors(scan_data['vendors'])
         
         # Build the enriched brand
         brand = EnrichedBrand(
@@ -128,55 +228,88 @@ class ProfileBuilder:
         )
         
         # Generate insights and recommendations
-        brand.insights = self._generate_insights(brand, sec_profile)
-        brand.recommendations = self._generate_recommendations(brand, sec_profile)
+        tech_summary = _summarize_tech(detected_technologies)
+        brand.insights = self._generate_insights(brand, sec_profile, tech_summary)
+        brand.recommendations = self._generate_recommendations(
+            brand, sec_profile, tech_summary
+        )
         
         # Update confidence based on data quality
         brand.confidence_level = self._determine_confidence_level(brand)
         
-        logger.info(f"Built profile for {domain}: score={brand.qualification_score}, "
-                   f"confidence={brand.confidence_level}")
+        logger.info("Built profile for %s: score=%d, confidence=%s",
+                    domain, brand.qualification_score, brand.confidence_level)
         
         return brand
     
+    def build_profiles_parallel(
+        self,
+        items: Iterable[Tuple[str, Optional[Dict[str, Any]], Optional[SECProfile]]],
+        workers: Optional[int] = None,
+        chunksize: int = 64
+    ) -> List[EnrichedBrand]:
+        """Build enriched brand profiles across a pool of worker processes.
+        
+        Profile builds are independent, so large sweeps scale with the
+        number of cores. Items are sent to workers in chunks to amortize
+        pickling overhead.
+        
+        Args:
+            items: (domain, scan_data, sec_profile) tuples.
+            workers: Number of worker processes. Defaults to the CPU count.
+            chunksize: Number of items sent to a worker per task.
+            
+        Returns:
+            EnrichedBrand profiles in the same order as ``items``.
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._build_item, items, chunksize=chunksize))
+    
+    def _build_item(
+        self,
+        item: Tuple[str, Optional[Dict[str, Any]], Optional[SECProfile]]
+    ) -> EnrichedBrand:
+        """Build one profile from a (domain, scan_data, sec_profile) tuple."""
+        domain, scan_data, sec_profile = item
+        return self.build_profile(domain, scan_data=scan_data, sec_profile=sec_profile)
+    
     def _calculate_data_completeness(
         self,
         scan_data: Dict[str, Any],
         sec_profile: Optional[SECProfile]
     ) -> float:
-        """Calculate data completeness ratio (0.0-1.0)."""
+        """Calculate data completeness ratio (0.0-1.0).
+        
+        Presence of each field is packed into one bit of ``filled``, so the
+        number of filled fields is a single popcount.
+        """
         total_fields = 0
-        filled_fields = 0
+        filled = 0
         
         # Check scan data
         if scan_data:
             total_fields += 3
-            if scan_data.get('detected_technologies') or scan_data.get('vendors'):
-                filled_fields += 1
-            if scan_data.get('requests'):
-                filled_fields += 1
-            if scan_data.get('scanned_at'):
-                filled_fields += 1
+            filled = (
+                bool(scan_data.get('detected_technologies') or scan_data.get('vendors'))
+                | bool(scan_data.get('requests')) << 1
+                | bool(scan_data.get('scanned_at')) << 2
+            )
         
         # Check SEC profile
         if sec_profile:
             total_fields += 6
-            if sec_profile.company_name:
-                filled_fields += 1
-            if sec_profile.sic_code:
-                filled_fields += 1
-            if sec_profile.exchange:
-                filled_fields += 1
-            if sec_profile.latest_financials:
-                filled_fields += 1
-            if sec_profile.filings_metadata:
-                filled_fields += 1
-            if sec_profile.entity_metadata:
-                filled_fields += 1
+            filled |= (
+                bool(sec_profile.company_name) << 3
+                | bool(sec_profile.sic_code) << 4
+                | bool(sec_profile.exchange) << 5
+                | bool(sec_profile.latest_financials) << 6
+                | bool(sec_profile.filings_metadata) << 7
+                | bool(sec_profile.entity_metadata) << 8
+            )
         else:
             total_fields += 1  # Missing SEC data
         
-        return filled_fields / total_fields if total_fields > 0 else 0.0
+        return filled.bit_count() / total_fields
     
     def _calculate_qualification_score(
         self,
@@ -195,25 +328,23 @@ class ProfileBuilder:
         
         # Revenue score (up to 40 points)
         if financials.revenue_usd:
-            for threshold, points in self.REVENUE_TIERS:
-                if financials.revenue_usd >= threshold:
-                    score += points
-                    break
+            score += _tier_points(
+                self._REVENUE_THRESHOLDS, self._REVENUE_POINTS,
+                financials.revenue_usd / 1_000_000_000
+            )
         
         # Employee count score (up to 25 points)
         if financials.employee_count:
-            for threshold, points in self.EMPLOYEE_TIERS:
-                if financials.employee_count >= threshold:
-                    score += points
-                    break
+            score += _tier_points(
+                self._EMPLOYEE_THRESHOLDS, self._EMPLOYEE_POINTS, financials.employee_count
+            )
         
         # Marketing spend score (up to 20 points)
         if financials.marketing_spend_usd and financials.revenue_usd:
             spend_ratio = financials.marketing_spend_usd / financials.revenue_usd
-            for threshold, points in self.MARKETING_SPEND_TIERS:
-                if spend_ratio >= threshold:
-                    score += points
-                    break
+            score += _tier_points(
+                self._MARKETING_THRESHOLDS, self._MARKETING_POINTS, spend_ratio
+            )
         
         # R&D investment score (up to 15 points)
         if financials.rd_spend_usd and financials.revenue_usd:
@@ -231,9 +362,14 @@ class ProfileBuilder:
     def _generate_insights(
         self,
         brand: EnrichedBrand,
-        sec_profile: Optional[SECProfile]
+        sec_profile: Optional[SECProfile],
+        tech_summary: Optional[Tuple[int, FrozenSet[str]]] = None
     ) -> List[str]:
-        """Generate marketing insights from the profile data."""
+        """Generate marketing insights from the profile data.
+        
+        ``tech_summary`` is the (count, categories) pair from
+        _summarize_tech(); it is computed from the brand when omitted.
+        """
         insights = []
         
         if not sec_profile or not sec_profile.latest_financials:
@@ -241,52 +377,51 @@ class ProfileBuilder:
             return insights
         
         financials = sec_profile.latest_financials
+        revenue = financials.revenue_usd
         
         # Revenue insights
-        if financials.revenue_usd:
-            revenue_b = financials.revenue_usd / 1_000_000_000
-            if revenue_b >= 100:
-                insights.append(f"Fortune 100 company with ${revenue_b:.0f}B revenue")
-            elif revenue_b >= 10:
-                insights.append(f"Large enterprise with ${revenue_b:.1f}B revenue")
-            elif revenue_b >= 1:
-                insights.append(f"Mid-market company with ${revenue_b:.1f}B revenue")
+        if revenue:
+            revenue_b = revenue / 1_000_000_000
+            for threshold, template in self.REVENUE_INSIGHT_RULES:
+                if revenue_b >= threshold:
+                    insights.append(template.format(revenue_b))
+                    break
             else:
-                revenue_m = financials.revenue_usd / 1_000_000
-                insights.append(f"Growth company with ${revenue_m:.0f}M revenue")
+                insights.append(f"Growth company with ${revenue / 1_000_000:.0f}M revenue")
         
         # Growth insights
-        if financials.revenue_growth_yoy is not None:
-            if financials.revenue_growth_yoy > 20:
-                insights.append(f"High growth: {financials.revenue_growth_yoy:.1f}% YoY revenue growth")
-            elif financials.revenue_growth_yoy > 10:
-                insights.append(f"Strong growth: {financials.revenue_growth_yoy:.1f}% YoY revenue growth")
-            elif financials.revenue_growth_yoy < -10:
-                insights.append(f"Declining revenue: {financials.revenue_growth_yoy:.1f}% YoY")
+        growth = financials.revenue_growth_yoy
+        if growth is not None:
+            for threshold, template in self.GROWTH_INSIGHT_RULES:
+                if growth > threshold:
+                    insights.append(template.format(growth))
+                    break
+            else:
+                if growth < -10:
+                    insights.append(f"Declining revenue: {growth:.1f}% YoY")
         
         # Employee insights
-        if financials.employee_count:
-            if financials.employee_count >= 100_000:
-                insights.append(f"Major employer with {financials.employee_count:,} employees")
-            elif financials.employee_count >= 10_000:
-                insights.append(f"Large organization with {financials.employee_count:,} employees")
-            elif financials.employee_count >= 1_000:
-                insights.append(f"Growing team: {financials.employee_count:,} employees")
+        employees = financials.employee_count
+        if employees:
+            for threshold, template in self.EMPLOYEE_INSIGHT_RULES:
+                if employees >= threshold:
+                    insights.append(template.format(employees))
+                    break
         
         # Marketing spend insights
-        if financials.marketing_spend_usd and financials.revenue_usd:
+        if financials.marketing_spend_usd and revenue:
             spend_m = financials.marketing_spend_usd / 1_000_000
-            spend_pct = (financials.marketing_spend_usd / financials.revenue_usd) * 100
+            spend_pct = (financials.marketing_spend_usd / revenue) * 100
             insights.append(f"Invests ${spend_m:.0f}M annually in marketing ({spend_pct:.1f}% of revenue)")
         
         # R&D insights
-        if financials.rd_spend_usd and financials.revenue_usd:
+        if financials.rd_spend_usd and revenue:
             rd_m = financials.rd_spend_usd / 1_000_000
-            rd_pct = (financials.rd_spend_usd / financials.revenue_usd) * 100
-            if rd_pct >= 10:
-                insights.append(f"Heavy R&D investment: ${rd_m:.0f}M ({rd_pct:.1f}% of revenue)")
-            elif rd_pct >= 5:
-                insights.append(f"Moderate R&D spend: ${rd_m:.0f}M ({rd_pct:.1f}% of revenue)")
+            rd_pct = (financials.rd_spend_usd / revenue) * 100
+            for threshold, template in self.RD_INSIGHT_RULES:
+                if rd_pct >= threshold:
+                    insights.append(template.format(rd_m, rd_pct))
+                    break
         
         # Industry insights
         if sec_profile.sic_description:
@@ -296,7 +431,9 @@ class ProfileBuilder:
             insights.append(f"Publicly traded on {sec_profile.exchange}")
         
         # Martech stack insights
-        tech_count = len(brand.detected_technologies)
+        if tech_summary is None:
+            tech_summary = _summarize_tech(brand.detected_technologies)
+        tech_count = tech_summary[0]
         if tech_count == 0:
             insights.append("Minimal martech stack detected - greenfield opportunity")
         elif tech_count <= 3:
@@ -309,9 +446,14 @@ class ProfileBuilder:
     def _generate_recommendations(
         self,
         brand: EnrichedBrand,
-        sec_profile: Optional[SECProfile]
+        sec_profile: Optional[SECProfile],
+        tech_summary: Optional[Tuple[int, FrozenSet[str]]] = None
     ) -> List[str]:
-        """Generate actionable recommendations based on the profile."""
+        """Generate actionable recommendations based on the profile.
+        
+        ``tech_summary`` is the (count, categories) pair from
+        _summarize_tech(); it is computed from the brand when omitted.
+        """
         recommendations = []
         
         if not sec_profile or not sec_profile.latest_financials:
@@ -320,56 +462,52 @@ class ProfileBuilder:
             return recommendations
         
         financials = sec_profile.latest_financials
+        revenue = financials.revenue_usd
+        revenue_b = revenue / 1_000_000_000 if revenue else None
         
         # Size-based recommendations
-        if financials.revenue_usd:
-            if financials.revenue_usd >= 10_000_000_000:
-                recommendations.append("Enterprise-grade solutions appropriate")
-                recommendations.append("Multi-stakeholder sales approach recommended")
-            elif financials.revenue_usd >= 1_000_000_000:
-                recommendations.append("Mid-market/enterprise hybrid approach")
-                recommendations.append("Emphasize scalability and ROI")
+        if revenue:
+            for threshold, recs in self.SIZE_RECOMMENDATION_RULES:
+                if revenue_b >= threshold:
+                    recommendations.extend(recs)
+                    break
             else:
-                recommendations.append("Growth-focused value proposition")
-                recommendations.append("Emphasize quick time-to-value")
+                recommendations.extend(self.GROWTH_RECOMMENDATIONS)
         
         # Marketing spend recommendations
-        if financials.marketing_spend_usd and financials.revenue_usd:
-            spend_ratio = financials.marketing_spend_usd / financials.revenue_usd
+        if financials.marketing_spend_usd and revenue:
+            spend_ratio = financials.marketing_spend_usd / revenue
             if spend_ratio < 0.05:
                 recommendations.append("Under-invested in marketing - opportunity for budget expansion")
             elif spend_ratio > 0.15:
                 recommendations.append("Heavy marketing spend - emphasize efficiency and optimization")
         
         # R&D recommendations
-        if financials.rd_spend_usd and financials.revenue_usd:
-            rd_ratio = financials.rd_spend_usd / financials.revenue_usd
+        if financials.rd_spend_usd and revenue:
+            rd_ratio = financials.rd_spend_usd / revenue
             if rd_ratio > 0.15:
                 recommendations.append("Innovation-focused company - emphasize cutting-edge solutions")
         
         # Martech stack recommendations
-        tech_categories = set()
-        for tech in brand.detected_technologies:
-            cat = tech.get('category', '')
-            if cat:
-                tech_categories.add(cat)
+        if tech_summary is None:
+            tech_summary = _summarize_tech(brand.detected_technologies)
+        tech_categories = tech_summary[1]
         
         if 'Analytics' not in tech_categories:
             recommendations.append("No analytics platform detected - high priority opportunity")
-        if 'CDP' not in tech_categories and financials.revenue_usd and financials.revenue_usd > 1_000_000_000:
+        if 'CDP' not in tech_categories and revenue and revenue_b > 1:
             recommendations.append("Enterprise company without CDP - data unification opportunity")
         if 'Social Media' not in tech_categories:
             recommendations.append("No social media tracking - consider social listening tools")
         
         # Industry-specific recommendations
         if sec_profile.sic_description:
-            sic_lower = sec_profile.sic_description.lower()
-            if 'retail' in sic_lower or 'electronic' in sic_lower:
-                recommendations.append("Retail focus - emphasize customer journey optimization")
-            if 'software' in sic_lower or 'computer' in sic_lower:
-                recommendations.append("Tech company - technical buyers, emphasize integration")
-            if 'health' in sic_lower or 'pharma' in sic_lower:
-                recommendations.append("Healthcare vertical - emphasize compliance and privacy")
+            matched = {
+                _INDUSTRY_RECOMMENDATIONS[keyword]
+                for keyword in _INDUSTRY_RE.findall(sec_profile.sic_description.lower())
+            }
+            if matched:
+                recommendations.extend(rec for rec in _INDUSTRY_ORDER if rec in matched)
         
         return recommendations
     
@@ -407,25 +545,31 @@ class ProfileBuilder:
             # Always update domain
             brand.domain = domain
             
+            # A brand that already carries insights or recommendations was
+            # scored upstream; only rescore when its technologies change
+            rescore = not (brand.insights or brand.recommendations)
+            
             # Update with scan data if provided
             if scan_data:
                 detected = scan_data.get('detected_technologies', [])
                 if not detected and 'vendors' in scan_data:
-                    detected = [
-                        {'vendor': v.get('vendor_name', 'Unknown'),
-                         'category': v.get('category', 'Unknown')}
-                        for v in scan_data.get('vendors', [])
-                    ]
+                    detected = _normalize_vendors(scan_data['vendors'])
                 brand.detected_technologies = detected
+                rescore = True
             
             # Recalculate score, insights and recommendations
-            brand.qualification_score = self._calculate_qualification_score(
-                brand.sec_profile, brand.detected_technologies
-            )
-            brand.insights = self._generate_insights(brand, brand.sec_profile)
-            brand.recommendations = self._generate_recommendations(
-                brand, brand.sec_profile
-            )
+            if rescore:
+                brand.qualification_score = self._calculate_qualification_score(
+                    brand.sec_profile, brand.detected_technologies
+                )
+                tech_summary = _summarize_tech(brand.detected_technologies)
+                brand.insights = self._generate_insights(
+                    brand, brand.sec_profile, tech_summary
+                )
+                brand.recommendations = self._generate_recommendations(
+                    brand, brand.sec_profile, tech_summary
+                )
+            
             brand.data_completeness = self._calculate_data_completeness(
                 scan_data or {}, brand.sec_profile
             )
@@ -434,7 +578,7 @@ class ProfileBuilder:
             return brand
         else:
             # Enrichment failed - build profile from scan data only
-            logger.warning(f"Enrichment failed for {domain}, building scan-only profile")
+            logger.warning("Enrichment failed for %s, building scan-only profile", domain)
             return self.build_profile(
                 domain=domain,
                 scan_data=scan_data,
@@ -2,34 +2,131 @@
 
 import json
 import re
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
+from typing import Callable, Iterable, NamedTuple
 from urllib.parse import urlparse, parse_qs
 
+try:
+    # Optional: several times faster than json for the bundled databases
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # Cache for tracker database
 _tracker_db_cache = None
 
+# Scheme (or protocol-relative //), optional userinfo, then the host
+# (bracketed IPv6 or up to port/path)
+_HOST_RE = re.compile(r'(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?//(?:[^/?#@]*@)?(\[[^\]]*\]|[^/?#:]*)')
+
+# Path of a URL, after the authority and before any query or fragment
+_PATH_RE = re.compile(r'(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?//[^/?#]*([^?#]*)')
+
+# Common infrastructure domains to skip when looking for unknown vendors
+_SKIP_DOMAINS = (
+    'google', 'googleapis', 'gstatic', 'googlesyndication', 'googletagmanager',
+    'facebook', 'fbcdn', 'doubleclick',
+    'cloudflare', 'cloudfront', 'akamai', 'fastly', 'cdn',
+    'jquery', 'bootstrap', 'unpkg', 'jsdelivr', 'cdnjs',
+    'fonts.', 'static.', 'assets.', 'images.', 'img.',
+    'amazonaws', 'azure', 'blob.core',
+)
+_SKIP_DOMAINS_RE = re.compile('|'.join(map(re.escape, _SKIP_DOMAINS)))
+
+# Multi-label public suffixes under which the registrable domain has three
+# labels (example.co.uk). Covers the common ccTLD second levels; anything
+# else falls back to the last two labels.
+_MULTI_LABEL_SUFFIXES = frozenset({
+    'co.uk', 'org.uk', 'ac.uk', 'gov.uk', 'ltd.uk', 'plc.uk', 'me.uk', 'net.uk',
+    'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au',
+    'co.nz', 'net.nz', 'org.nz', 'govt.nz',
+    'co.jp', 'ne.jp', 'or.jp', 'ac.jp', 'go.jp',
+    'co.kr', 'or.kr', 'ne.kr',
+    'com.cn', 'net.cn', 'org.cn', 'gov.cn',
+    'com.hk', 'com.tw', 'com.sg', 'com.my', 'com.ph', 'com.vn',
+    'co.in', 'net.in', 'org.in', 'firm.in',
+    'co.id', 'co.th', 'in.th', 'co.il',
+    'com.br', 'net.br', 'org.br', 'com.mx', 'com.ar', 'com.co', 'com.pe',
+    'co.za', 'com.ng', 'co.ke', 'com.eg',
+    'com.tr', 'com.sa', 'com.pk', 'com.ua', 'com.pl',
+})
+
+# Parsed vendors.json per file: path -> ((mtime_ns, size), vendors)
+_vendors_cache = {}
+
+# Ordered categories for the most recently seen vendor tuple: (vendors, categories)
+_categories_cache = None
+
+# Domain index for the most recently matched vendor tuple: (vendors, rules, hosts, path rules)
+_vendor_index_cache = None
+
+
+class _UrlPattern(NamedTuple):
+    """A url_pattern with its extraction branches resolved once."""
+    pattern: str
+    query_param: str | None       # "lcid=" -> "lcid"
+    dash_re: re.Pattern | None    # "UA-" -> matches "UA-1234-5"
+    path_id_re: re.Pattern        # "gtag/js" -> matches "gtag/js?id=..."
+    extract: Callable[[str, '_UrlPattern'], str | None]  # specialized for the pattern's shape
+
+
+@dataclass(slots=True)
+class VendorRule:
+    """Matching form of a vendor fingerprint, compiled once per vendor list."""
+    name: str
+    category: str
+    domains: tuple[str, ...]             # lowercased
+    url_patterns: tuple[_UrlPattern, ...]
+
+
+def _netloc(url: str) -> str:
+    """Return the lowercased host of a URL, without userinfo or port ('' if none)."""
+    match = _HOST_RE.match(url)
+    return match.group(1).lower() if match else ''
+
+
+def _read_data_file(filename: str) -> bytes | None:
+    """Read a bundled data file, or return None if it does not exist."""
+    try:
+        return resources.files('mscan.data').joinpath(filename).read_bytes()
+    except (TypeError, FileNotFoundError):
+        # Fallback for development mode
+        data_file = Path(__file__).parent / 'data' / filename
+        return data_file.read_bytes() if data_file.exists() else None
+
 
 def load_tracker_db() -> dict:
-    """Load the tracker database (whotracks.me data) for fallback matching."""
+    """
+    Load the tracker database (whotracks.me data) for fallback matching.
+
+    Thousands of domains share a handful of (vendor, category, source) entries,
+    so identical entries are collapsed into one shared dict after parsing. The
+    returned database is cached and must be treated as read-only.
+    """
     global _tracker_db_cache
     
     if _tracker_db_cache is not None:
         return _tracker_db_cache
     
-    try:
-        with resources.files('mscan.data').joinpath('tracker_db.json').open('r') as f:
-            _tracker_db_cache = json.load(f)
-    except (TypeError, FileNotFoundError):
-        # Fallback for development mode
-        tracker_file = Path(__file__).parent / 'data' / 'tracker_db.json'
-        if tracker_file.exists():
-            with open(tracker_file, 'r') as f:
-                _tracker_db_cache = json.load(f)
-        else:
-            _tracker_db_cache = {"domains": {}}
-    
+    raw = _read_data_file('tracker_db.json')
+    if raw is None:
+        _tracker_db_cache = {"domains": {}}
+        return _tracker_db_cache
+
+    data = _json_loads(raw)
+    domains = data.get("domains", {})
+    shared = {}
+    for domain, info in domains.items():
+        key = (info.get("vendor"), info.get("category"), info.get("source"))
+        domains[domain] = shared.setdefault(key, info)
+
+    _tracker_db_cache = data
     return _tracker_db_cache
 
 
@@ -43,57 +140,110 @@ def match_tracker_db(domain: str) -> dict | None:
     Returns:
         Match dict with vendor/category if found, None otherwise
     """
-    tracker_db = load_tracker_db()
-    domains_db = tracker_db.get("domains", {})
-    
-    # Normalize domain
-    domain_clean = domain.lower().replace("www.", "")
-    
-    # Try exact match first
-    if domain_clean in domains_db:
-        info = domains_db[domain_clean]
-        return {
-            "vendor_name": info["vendor"],
-            "category": info["category"],
-            "source": "tracker_db",
-            "matching_domains": [domain_clean],
-            "details": ""
-        }
-    
-    # Try base domain (e.g., "sub.example.com" -> "example.com")
-    parts = domain_clean.split(".")
-    if len(parts) >= 2:
-        base_domain = ".".join(parts[-2:])
-        if base_domain in domains_db:
-            info = domains_db[base_domain]
-            return {
-                "vendor_name": info["vendor"],
-                "category": info["category"],
-                "source": "tracker_db",
-                "matching_domains": [base_domain],
-                "details": ""
-            }
-    
+    match = _tracker_lookup(domain.lower().replace("www.", ""))
+    if match is None:
+        return None
+
+    vendor_name, category, matched_domain = match
+    return {
+        "vendor_name": vendor_name,
+        "category": category,
+        "source": "tracker_db",
+        "matching_domains": [matched_domain],
+        "details": ""
+    }
+
+
+@lru_cache(maxsize=4096)
+def _tracker_lookup(domain_clean: str) -> tuple[str, str, str] | None:
+    """
+    Find the most specific tracker_db entry for a normalized domain.
+
+    Walks the domain and its parent domains ("a.b.example.com",
+    "b.example.com", "example.com") and stops before the bare TLD.
+
+    Returns:
+        (vendor, category, matched domain) or None
+    """
+    domains_db = load_tracker_db().get("domains", {})
+
+    for depth, candidate in enumerate(_host_suffixes(domain_clean)):
+        if depth and '.' not in candidate:
+            break
+        info = domains_db.get(candidate)
+        if info is not None:
+            return info["vendor"], info["category"], candidate
+
     return None
 
 
-def load_vendors(vendors_file: str = None) -> list[dict]:
-    """Load vendor fingerprints from JSON file."""
-    if vendors_file is None:
-        # Use importlib.resources to find the bundled vendors.json
-        try:
-            with resources.files('mscan.data').joinpath('vendors.json').open('r') as f:
-                data = json.load(f)
-        except (TypeError, FileNotFoundError):
-            # Fallback for development mode
-            vendors_file = Path(__file__).parent / 'data' / 'vendors.json'
-            with open(vendors_file, 'r') as f:
-                data = json.load(f)
-    else:
-        with open(vendors_file, 'r') as f:
-            data = json.load(f)
+def load_vendors(vendors_file: str = None) -> tuple[dict, ...]:
+    """
+    Load vendor fingerprints from JSON file.
 
-    return data.get('vendors', [])
+    Domains are lowercased and vendor strings interned once at load time. The
+    parsed vendors are cached per file and reloaded when the file's mtime or
+    size changes on disk. They are shared between callers, so they come back
+    as a tuple, and the vendor dicts must not be modified; copy a vendor
+    before editing it.
+    """
+    source = _vendors_source(vendors_file)
+    try:
+        version = _file_version(source)
+    except FileNotFoundError:
+        if vendors_file is not None:
+            raise
+        # Fallback for development mode
+        source = get_vendors_path()
+        version = _file_version(source)
+
+    cache_key = str(source)
+    cached = _vendors_cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data = _json_loads(source.read_bytes())
+    vendors = tuple(data.get('vendors', []))
+    for vendor in vendors:
+        _canonicalize_vendor(vendor)
+
+    _vendors_cache[cache_key] = (version, vendors)
+    return vendors
+
+
+def _file_version(source) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    if not hasattr(source, 'stat'):
+        return None
+    st = source.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _vendors_source(vendors_file: str | None):
+    """Resolve the vendors.json to read: an explicit path or the bundled file."""
+    if vendors_file is not None:
+        return Path(vendors_file)
+    # Use importlib.resources to find the bundled vendors.json
+    try:
+        return resources.files('mscan.data').joinpath('vendors.json')
+    except TypeError:
+        # Fallback for development mode
+        return get_vendors_path()
+
+
+def _canonicalize_vendor(vendor: dict) -> None:
+    """Lowercase detection domains and intern the strings of a vendor in place."""
+    for key in ('vendor_name', 'category'):
+        if isinstance(vendor.get(key), str):
+            vendor[key] = sys.intern(vendor[key])
+
+    rules = vendor.get('detection_rules')
+    if not rules:
+        return
+    if 'domains' in rules:
+        rules['domains'] = [sys.intern(d.lower()) for d in rules['domains']]
+    if 'url_patterns' in rules:
+        rules['url_patterns'] = [sys.intern(p) for p in rules['url_patterns']]
 
 
 def get_vendors_path() -> Path:
@@ -101,6 +251,20 @@ def get_vendors_path() -> Path:
     return Path(__file__).parent / 'data' / 'vendors.json'
 
 
+def warm_caches() -> None:
+    """
+    Load the fingerprint databases and compile the vendor index ahead of use.
+
+    Everything here is cached at module level, so running this in a background
+    thread while a page scan is in flight takes the parsing off the critical
+    path of the first match.
+    """
+    vendors = load_vendors()
+    _vendor_domain_index(vendors)
+    get_all_categories(vendors)
+    load_tracker_db()
+
+
 def match_vendors_extended(requests: list[str], vendors: list[dict] = None) -> list[dict]:
     """
     Match requests against vendors.json AND tracker_db.json (fallback).
@@ -115,43 +279,76 @@ def match_vendors_extended(requests: list[str], vendors: list[dict] = None) -> l
     Returns:
         List of detected vendors with details
     """
-    # First, get matches from vendors.json (priority)
-    detected = match_vendors(requests, vendors)
+    if vendors is None:
+        vendors = load_vendors()
+
+    parsed = _parse_requests(dict.fromkeys(requests))
+    return _add_tracker_matches(_match_parsed_vendors(parsed, vendors), parsed)
+
+
+def scan_requests(requests: list[str], base_domain: str, vendors: list[dict] = None) -> dict:
+    """
+    Match vendors (vendors.json + tracker_db.json) and find unknown domains.
+
+    Equivalent to match_vendors_extended() followed by find_unknown_domains(),
+    but each request URL is parsed only once for all three passes.
+
+    Args:
+        requests: List of captured request URLs
+        base_domain: The domain being scanned (to exclude first-party requests)
+        vendors: List of vendor fingerprints (loads from file if not provided)
+
+    Returns:
+        Dict with 'vendors' (detected vendors) and 'unknown' (unknown domains)
+    """
+    if vendors is None:
+        vendors = load_vendors()
+
+    # Browsers fire the same beacon many times; match each URL once and keep
+    # the multiplicity for the unknown-domain counts
+    request_counts = Counter(requests)
+    parsed = _parse_requests(request_counts)
+    return {
+        'vendors': _add_tracker_matches(_match_parsed_vendors(parsed, vendors), parsed),
+        'unknown': _find_unknown_parsed(parsed, request_counts, base_domain, vendors),
+    }
+
+
+def _add_tracker_matches(detected: list[dict], parsed_requests: list[tuple[str, str, str]]) -> list[dict]:
+    """Append tracker_db matches for request hosts not covered by vendors.json matches."""
+    # Hosts, vendor domains and tracker domains are all lowercased already
     detected_vendor_names = {v['vendor_name'].lower() for v in detected}
     
-    # Track domains we've already matched
-    matched_domains = set()
+    # Hosts already matched or already looked up
+    checked_hosts = set()
     for v in detected:
-        for d in v.get('matching_domains', []):
-            matched_domains.add(d.lower())
+        checked_hosts.update(v.get('matching_domains', []))
     
     # Now check tracker_db for additional matches
-    for request_url in requests:
-        parsed = urlparse(request_url)
-        domain = parsed.netloc.lower()
-        
-        if not domain or domain in matched_domains:
+    for domain, _, _ in parsed_requests:
+        if not domain or domain in checked_hosts:
             continue
+        checked_hosts.add(domain)
         
         # Check tracker_db
-        tracker_match = match_tracker_db(domain)
+        tracker_match = _tracker_lookup(domain.replace("www.", ""))
         if tracker_match:
-            vendor_name = tracker_match['vendor_name']
+            vendor_name, category, matched_domain = tracker_match
             # Skip if we already have this vendor from vendors.json
-            if vendor_name.lower() in detected_vendor_names:
+            vendor_key = vendor_name.lower()
+            if vendor_key in detected_vendor_names:
                 continue
             
             # Add to detected list
             detected.append({
                 'vendor_name': vendor_name,
-                'category': tracker_match['category'],
+                'category': category,
                 'detected': True,
-                'matching_domains': tracker_match['matching_domains'],
+                'matching_domains': [matched_domain],
                 'details': '',
                 'source': 'tracker_db'
             })
-            detected_vendor_names.add(vendor_name.lower())
-            matched_domains.add(domain)
+            detected_vendor_names.add(vendor_key)
     
     return detected
 
@@ -170,14 +367,40 @@ def match_vendors(requests: list[str], vendors: list[dict] = None) -> list[dict]
     if vendors is None:
         vendors = load_vendors()
 
+    return _match_parsed_vendors(_parse_requests(dict.fromkeys(requests)), vendors)
+
+
+def _match_parsed_vendors(parsed_requests: list[tuple[str, str, str]], vendors: list[dict]) -> list[dict]:
+    """Match pre-parsed requests (see _parse_requests) against vendor fingerprints."""
+    rules, hosts, path_hosts = _vendor_domain_index(vendors)
+
+    # Single pass over the requests: route each parsed URL to the vendors
+    # whose domains it hits, so per-vendor matching only sees its own.
+    # Most URLs share a handful of hosts, so host routing is done once per host.
+    host_vendors = {}
+    vendor_requests = {}
+    for parsed in parsed_requests:
+        host, url_lower, _ = parsed
+        hit_vendors = host_vendors.get(host)
+        if hit_vendors is None:
+            hit_vendors = host_vendors[host] = _route_host(host, hosts)
+        if path_hosts:
+            hit_vendors = hit_vendors | _route_path(host, url_lower, path_hosts)
+        for vendor_idx in hit_vendors:
+            if vendor_idx in vendor_requests:
+                vendor_requests[vendor_idx].append(parsed)
+            else:
+                vendor_requests[vendor_idx] = [parsed]
+
     detected = []
 
-    for vendor in vendors:
-        match_result = _check_vendor_match(requests, vendor)
+    for vendor_idx in sorted(vendor_requests):
+        rule = rules[vendor_idx]
+        match_result = _check_vendor_match(vendor_requests[vendor_idx], rule)
         if match_result['detected']:
             detected.append({
-                'vendor_name': vendor['vendor_name'],
-                'category': vendor['category'],
+                'vendor_name': rule.name,
+                'category': rule.category,
                 'detected': True,
                 'matching_domains': match_result['matching_domains'],
                 'details': match_result['details']
@@ -186,65 +409,288 @@ def match_vendors(requests: list[str], vendors: list[dict] = None) -> list[dict]
     return detected
 
 
-def _check_vendor_match(requests: list[str], vendor: dict) -> dict:
-    """Check if a vendor's fingerprint matches any of the captured requests."""
-    rules = vendor.get('detection_rules', {})
-    domains = rules.get('domains', [])
-    url_patterns = rules.get('url_patterns', [])
+def _vendor_domain_index(vendors: list[dict]) -> tuple[list[VendorRule], dict[str, tuple[int, ...]], dict[str, tuple[tuple[str, tuple[int, ...]], ...]]]:
+    """
+    Compile vendor rules and build lookup structures over every vendor domain.
 
-    matching_domains = []
-    details = []
+    Each vendor dict is compiled into a VendorRule with lowercased domains and
+    pre-classified URL patterns, so matching never walks the nested dicts.
 
-    for request_url in requests:
-        parsed = urlparse(request_url)
-        request_domain = parsed.netloc.lower()
-        full_url = request_url.lower()
+    Plain domains go into a hash index keyed by domain, so a request host is
+    matched by looking up each of its dot-suffixes. The few rules that carry a
+    path (e.g. "facebook.com/tr") are indexed the same way by their host part,
+    each with its path prefix, so they respect host boundaries too.
 
-        # Check domain matches
-        for domain in domains:
-            if domain.lower() in request_domain or domain.lower() in full_url:
-                if domain not in matching_domains:
-                    matching_domains.append(domain)
+    The index is cached only for a vendor tuple (as shared by load_vendors),
+    keyed by identity. A caller's list may be changed in place between
+    calls, so it is indexed afresh each time.
+
+    Args:
+        vendors: List of vendor fingerprints
+
+    Returns:
+        Tuple of (vendor rules, host index, path-rule host index mapping each
+        host to (path prefix, vendor indices) pairs); indices refer to both
+        vendors and rules
+    """
+    global _vendor_index_cache
+
+    cacheable = type(vendors) is tuple
+    if cacheable and _vendor_index_cache is not None and _vendor_index_cache[0] is vendors:
+        return _vendor_index_cache[1:]
+
+    rules = [_compile_vendor(vendor) for vendor in vendors]
+
+    hosts = {}
+    path_rules = {}
+    for vendor_idx, rule in enumerate(rules):
+        for domain in rule.domains:
+            if '/' in domain:
+                host, _, path = domain.partition('/')
+                path_rules.setdefault(host, {}).setdefault('/' + path, []).append(vendor_idx)
+            else:
+                hosts.setdefault(domain, []).append(vendor_idx)
+
+    hosts = {domain: tuple(dict.fromkeys(ids)) for domain, ids in hosts.items()}
+    path_hosts = {
+        host: tuple((path, tuple(dict.fromkeys(ids))) for path, ids in paths.items())
+        for host, paths in path_rules.items()
+    }
+
+    if cacheable:
+        _vendor_index_cache = (vendors, rules, hosts, path_hosts)
+    return rules, hosts, path_hosts
+
+
+def _compile_vendor(vendor: dict) -> VendorRule:
+    """Compile a vendor fingerprint dict into its matching form."""
+    detection_rules = vendor.get('detection_rules', {})
+    return VendorRule(
+        name=vendor['vendor_name'],
+        category=vendor['category'],
+        domains=tuple(d.lower() for d in detection_rules.get('domains', [])),
+        url_patterns=tuple(_compile_pattern(p) for p in detection_rules.get('url_patterns', [])),
+    )
+
+
+def _route_host(host: str, hosts: dict[str, tuple[int, ...]]) -> frozenset[int]:
+    """Collect the vendor indices whose plain domains match a host or its parents."""
+    hit_vendors = []
+    while host:
+        vendor_ids = hosts.get(host)
+        if vendor_ids:
+            hit_vendors.extend(vendor_ids)
+        dot = host.find('.')
+        if dot < 0:
+            break
+        host = host[dot + 1:]
+    return frozenset(hit_vendors)
+
+
+def _route_path(host: str, url_lower: str, path_hosts: dict[str, tuple[tuple[str, tuple[int, ...]], ...]]) -> frozenset[int]:
+    """Collect the vendor indices whose path rules match a request."""
+    hit_vendors = []
+    path = None
+    for suffix in _host_suffixes(host):
+        entries = path_hosts.get(suffix)
+        if entries:
+            if path is None:
+                path = _url_path(url_lower)
+            for prefix, vendor_ids in entries:
+                if path.startswith(prefix):
+                    hit_vendors.extend(vendor_ids)
+    return frozenset(hit_vendors)
+
+
+def _host_suffixes(host: str):
+    """Yield a host and each of its parent domains ("a.b.com", "b.com", "com")."""
+    while host:
+        yield host
+        dot = host.find('.')
+        if dot < 0:
+            return
+        host = host[dot + 1:]
+
+
+def _domain_matches(domain: str, host: str, url_lower: str) -> bool:
+    """
+    Check a lowercased vendor domain against a request.
+
+    Plain domains match the request host or any of its subdomains. Rules with
+    a path ("facebook.com/tr") match the same way on their host part, and the
+    request path must start with their path part.
+    """
+    if '/' in domain:
+        domain, _, path = domain.partition('/')
+        if not (host == domain or host.endswith('.' + domain)):
+            return False
+        return _url_path(url_lower).startswith('/' + path)
+    return host == domain or host.endswith('.' + domain)
+
+
+def _url_path(url: str) -> str:
+    """Return the path of a URL ('' if it has none)."""
+    match = _PATH_RE.match(url)
+    return match.group(1) if match else ''
+
+
+@lru_cache(maxsize=4096)
+def get_base_domain(domain: str) -> str:
+    """
+    Get the registrable domain of a host for grouping.
 
-                # Try to extract client IDs from URL patterns
-                for pattern in url_patterns:
-                    extracted = _extract_id_from_url(request_url, pattern)
-                    if extracted and extracted not in details:
-                        details.append(extracted)
+    Args:
+        domain: Lowercased host, e.g. "cdn.shop.example.co.uk"
+
+    Returns:
+        Registrable domain, e.g. "example.co.uk"; the host itself if it has
+        fewer labels than that
+    """
+    parts = domain.rsplit('.', 3)
+    if len(parts) >= 3 and f'{parts[-2]}.{parts[-1]}' in _MULTI_LABEL_SUFFIXES:
+        return '.'.join(parts[-3:])
+    return '.'.join(parts[-2:])
+
+
+def _parse_requests(requests: Iterable[str]) -> list[tuple[str, str, str]]:
+    """
+    Pre-parse request URLs into (host, lowercased URL, URL) tuples.
+
+    Callers pass de-duplicated URLs (in first-seen order); vendor matching
+    collects ordered sets, so repeats would not change its result.
+    """
+    return [(_netloc(url), url.lower(), url) for url in requests]
+
+
+def _check_vendor_match(parsed_requests: list[tuple[str, str, str]], rule: VendorRule) -> dict:
+    """
+    Check if a vendor's fingerprint matches any of the captured requests.
+
+    Args:
+        parsed_requests: (host, lowercased URL, URL) tuples from _parse_requests()
+        rule: Compiled vendor fingerprint
+
+    Returns:
+        Dict with detected flag, matching domains and extracted details
+    """
+    # Dicts used as insertion-ordered sets
+    matching_domains = {}
+    details = {}
+
+    for request_domain, full_url, request_url in parsed_requests:
+        # Check domain matches
+        matched = False
+        for domain in rule.domains:
+            if _domain_matches(domain, request_domain, full_url):
+                matching_domains[domain] = None
+                matched = True
+
+        # Try to extract client IDs from URL patterns
+        if matched:
+            for url_pattern in rule.url_patterns:
+                extracted = url_pattern.extract(request_url, url_pattern)
+                if extracted:
+                    details[extracted] = None
 
     return {
         'detected': len(matching_domains) > 0,
-        'matching_domains': matching_domains,
+        'matching_domains': list(matching_domains),
         'details': ', '.join(details) if details else ''
     }
 
 
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> _UrlPattern:
+    """
+    Classify a url_pattern and compile its regexes.
+
+    The pattern's shape decides which extraction branches can apply, so the
+    extractor is picked here once instead of being re-derived per request.
+    """
+    is_query = '=' in pattern
+    is_dash = pattern.endswith('-')
+    if is_query and is_dash:
+        extract = _extract_id
+    elif is_query:
+        extract = _extract_query_id
+    elif is_dash:
+        extract = _extract_dash_id
+    else:
+        extract = _extract_path_id
+
+    return _UrlPattern(
+        pattern=pattern,
+        query_param=pattern.rstrip('=') if is_query else None,
+        dash_re=re.compile(rf'({re.escape(pattern)}[\w-]+)') if is_dash else None,
+        path_id_re=re.compile(rf'{re.escape(pattern)}[?&]id=([^&]+)'),
+        extract=extract,
+    )
+
+
 def _extract_id_from_url(url: str, pattern: str) -> str | None:
     """Try to extract a client ID or identifier from a URL based on a pattern."""
+    url_pattern = _compile_pattern(pattern)
+    return url_pattern.extract(url, url_pattern)
+
+
+def _extract_id(url: str, url_pattern: _UrlPattern) -> str | None:
+    """Extract an identifier from a URL using a compiled url_pattern."""
+    # Most patterns are absent from most URLs; a substring probe is far
+    # cheaper than parsing the query or running a regex. Query keys may be
+    # percent-encoded, so those URLs are always parsed.
+    present = url_pattern.pattern in url
+
     # Handle query parameter patterns (e.g., "lcid=", "id=")
-    if '=' in pattern:
-        param_name = pattern.rstrip('=')
+    param_name = url_pattern.query_param
+    if param_name is not None and (present or '%' in url):
         parsed = urlparse(url)
         params = parse_qs(parsed.query)
         if param_name in params:
             return f"{param_name}={params[param_name][0]}"
 
     # Handle patterns like "UA-", "G-", "AW-" (Google IDs)
-    if pattern.endswith('-'):
-        match = re.search(rf'({re.escape(pattern)}[\w-]+)', url)
+    if present and url_pattern.dash_re is not None:
+        match = url_pattern.dash_re.search(url)
         if match:
             return match.group(1)
 
     # Handle path patterns like "gtag/js"
-    if pattern in url:
+    if present:
         # Try to extract associated ID
-        match = re.search(rf'{re.escape(pattern)}[?&]id=([^&]+)', url)
+        match = url_pattern.path_id_re.search(url)
         if match:
             return match.group(1)
 
     return None
 
 
+def _extract_query_id(url: str, url_pattern: _UrlPattern) -> str | None:
+    """_extract_id() for query parameter patterns ("lcid=")."""
+    present = url_pattern.pattern in url
+    if present or '%' in url:
+        params = parse_qs(urlparse(url).query)
+        param_name = url_pattern.query_param
+        if param_name in params:
+            return f"{param_name}={params[param_name][0]}"
+    return _extract_path_id(url, url_pattern) if present else None
+
+
+def _extract_dash_id(url: str, url_pattern: _UrlPattern) -> str | None:
+    """_extract_id() for ID prefix patterns ("UA-")."""
+    if url_pattern.pattern not in url:
+        return None
+    match = url_pattern.dash_re.search(url) or url_pattern.path_id_re.search(url)
+    return match.group(1) if match else None
+
+
+def _extract_path_id(url: str, url_pattern: _UrlPattern) -> str | None:
+    """_extract_id() for path patterns ("gtag/js")."""
+    if url_pattern.pattern not in url:
+        return None
+    match = url_pattern.path_id_re.search(url)
+    return match.group(1) if match else None
+
+
 def find_unknown_domains(requests: list[str], base_domain: str, vendors: list[dict] = None) -> list[dict]:
     """
     Find third-party domains in requests that aren't in the vendor database.
@@ -260,31 +706,39 @@ def find_unknown_domains(requests: list[str], base_domain: str, vendors: list[di
     if vendors is None:
         vendors = load_vendors()
 
-    # Build set of all known vendor domains
-    known_domains = set()
-    for vendor in vendors:
-        rules = vendor.get('detection_rules', {})
-        for domain in rules.get('domains', []):
-            known_domains.add(domain.lower())
-
-    # Common infrastructure domains to skip
-    skip_domains = [
-        'google', 'googleapis', 'gstatic', 'googlesyndication', 'googletagmanager',
-        'facebook', 'fbcdn', 'doubleclick',
-        'cloudflare', 'cloudfront', 'akamai', 'fastly', 'cdn',
-        'jquery', 'bootstrap', 'unpkg', 'jsdelivr', 'cdnjs',
-        'fonts.', 'static.', 'assets.', 'images.', 'img.',
-        'amazonaws', 'azure', 'blob.core',
-    ]
+    request_counts = Counter(requests)
+    return _find_unknown_parsed(_parse_requests(request_counts), request_counts, base_domain, vendors)
 
-    # Extract and count unique domains
-    domain_info = {}
-    base_clean = base_domain.lower().replace('www.', '')
 
-    for req in requests:
-        parsed = urlparse(req)
-        domain = parsed.netloc.lower()
+def _find_unknown_parsed(
+    parsed_requests: list[tuple[str, str, str]],
+    request_counts: dict[str, int],
+    base_domain: str,
+    vendors: list[dict],
+) -> list[dict]:
+    """
+    Find unknown third-party domains in pre-parsed requests.
+
+    Args:
+        parsed_requests: Unique requests parsed by _parse_requests()
+        request_counts: Number of times each request URL was captured
+        base_domain: The domain being scanned
+        vendors: List of vendor fingerprints
+
+    Returns:
+        List of unknown domain dicts, as for find_unknown_domains()
+    """
+    # Known vendor hosts; rules with a path (e.g. "facebook.com/tr") count by host
+    _, hosts, path_hosts = _vendor_domain_index(vendors)
+    known_domains = hosts.keys() | path_hosts.keys()
+
+    # Per base domain columns: request count, distinct hosts, first distinct URLs
+    counts = {}
+    hosts_seen = {}
+    samples = {}
+    base_clean = base_domain.lower().replace('www.', '')
 
+    for domain, _, req in parsed_requests:
         if not domain:
             continue
 
@@ -293,57 +747,54 @@ def find_unknown_domains(requests: list[str], base_domain: str, vendors: list[di
             continue
 
         # Skip common infrastructure
-        if any(skip in domain for skip in skip_domains):
+        if _SKIP_DOMAINS_RE.search(domain):
             continue
 
-        # Check if matches any known vendor domain
-        is_known = False
-        for known in known_domains:
-            if known in domain or domain in known:
-                is_known = True
-                break
-
-        if is_known:
+        # Skip hosts that are (subdomains of) known vendor domains
+        if any(suffix in known_domains for suffix in _host_suffixes(domain)):
             continue
         
         # Check if matches tracker_db (whotracks.me fallback)
-        if match_tracker_db(domain):
+        if _tracker_lookup(domain.replace('www.', '')):
             continue
 
         # Extract base domain for grouping
-        parts = domain.split('.')
-        if len(parts) >= 2:
-            base = '.'.join(parts[-2:])
+        base = get_base_domain(domain)
+
+        if base in counts:
+            counts[base] += request_counts[req]
+            hosts_seen[base].add(domain)
+            if len(samples[base]) < 3:
+                samples[base].append(req)
         else:
-            base = domain
-
-        if base not in domain_info:
-            domain_info[base] = {'domain': base, 'count': 0, 'full_domains': set(), 'sample_urls': []}
-
-        domain_info[base]['count'] += 1
-        domain_info[base]['full_domains'].add(domain)
-        if len(domain_info[base]['sample_urls']) < 3:
-            domain_info[base]['sample_urls'].append(req)
-
-    # Convert to list and sort by count
-    result = []
-    for base, info in domain_info.items():
-        result.append({
-            'domain': base,
-            'count': info['count'],
-            'full_domains': list(info['full_domains']),
-            'sample_urls': info['sample_urls']
-        })
-
-    result.sort(key=lambda x: x['count'], reverse=True)
-    return result
+            counts[base] = request_counts[req]
+            hosts_seen[base] = {domain}
+            samples[base] = [req]
+
+    # Sorted by count; ties keep first-seen order
+    return [
+        {'domain': base, 'count': counts[base], 'full_domains': list(hosts_seen[base]), 'sample_urls': samples[base]}
+        for base in sorted(counts, key=counts.get, reverse=True)
+    ]
 
 
 def get_all_categories(vendors: list[dict] = None) -> list[str]:
-    """Get all unique categories from vendor list."""
+    """
+    Get all unique categories from vendor list.
+
+    The result is cached for the most recent vendor tuple (by identity), which
+    load_vendors() shares between calls until vendors.json changes. A list
+    may be changed in place by its owner, so it is never served from cache.
+    """
+    global _categories_cache
+
     if vendors is None:
         vendors = load_vendors()
 
+    cacheable = type(vendors) is tuple
+    if cacheable and _categories_cache is not None and _categories_cache[0] is vendors:
+        return list(_categories_cache[1])
+
     categories = set()
     for vendor in vendors:
         categories.add(vendor.get('category', 'Other/Uncategorized'))
@@ -368,4 +819,7 @@ def get_all_categories(vendors: list[dict] = None) -> list[str]:
     ordered = [c for c in preferred_order if c in categories]
     remaining = [c for c in categories if c not in preferred_order]
 
-    return ordered + sorted(remaining)
+    result = ordered + sorted(remaining)
+    if cacheable:
+        _categories_cache = (vendors, tuple(result))
+    return result
@@ -2,36 +2,43 @@
 
 Defines structured models for company metadata, financials, and enriched profiles.
 Compatible with Pydantic v2.
+
+Small records built by the enricher from already-parsed SEC responses
+(filings, executives, risk factors, events, results and errors) are plain
+slotted dataclasses; Pydantic validation is kept for the profile models.
 """
 
-from typing import Optional, List, Dict, Any, Union
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Literal, Union
 from datetime import datetime
-from enum import Enum
 
 from pydantic import BaseModel, Field, ConfigDict
 
 
-class EntityType(str, Enum):
-    """SEC entity types."""
-    OPERATING = "operating"
-    SHELL = "shell company"
-    OTHER = "other"
+# SEC entity types
+EntityType = Literal["operating", "shell company", "other"]
+
+# Common SEC filing form types
+FilingType = Literal["10-K", "10-Q", "8-K", "4", "DEF 14A", "S-1", "13F-HR", "20-F", "6-K"]
+
 
+class _TrustedModel(BaseModel):
+    """Base for profile models that are also built from already-validated data."""
 
-class FilingType(str, Enum):
-    """Common SEC filing form types."""
-    FORM_10_K = "10-K"
-    FORM_10_Q = "10-Q"
-    FORM_8_K = "8-K"
-    FORM_4 = "4"
-    FORM_DEF_14A = "DEF 14A"
-    FORM_S_1 = "S-1"
-    FORM_13F = "13F-HR"
-    FORM_20_F = "20-F"
-    FORM_6_K = "6-K"
+    @classmethod
+    def from_trusted(cls, **data: Any):
+        """Build an instance without running validation.
 
+        Only for data that has already been validated, such as models
+        assembled from other model instances or loaded back from our own
+        cache. Defaults are still applied; constraints and nested
+        coercion are not. Use the normal constructor for anything that
+        comes from outside (API responses, user input).
+        """
+        return cls.model_construct(**data)
 
-class FinancialMetrics(BaseModel):
+
+class FinancialMetrics(_TrustedModel):
     """Key financial metrics extracted from SEC filings.
     
     Attributes:
@@ -45,7 +52,7 @@ class FinancialMetrics(BaseModel):
         fiscal_year: Fiscal year identifier (e.g., "2024").
         period_end: End date of the reporting period (ISO format).
     """
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     
     revenue_usd: Optional[int] = Field(None, description="Annual revenue in USD")
     revenue_growth_yoy: Optional[float] = Field(None, description="YoY revenue growth %")
@@ -58,7 +65,8 @@ class FinancialMetrics(BaseModel):
     period_end: Optional[str] = Field(None, description="Period end date (ISO)")
 
 
-class Filing(BaseModel):
+@dataclass(slots=True)
+class Filing:
     """Represents a single SEC filing.
     
     Attributes:
@@ -69,18 +77,17 @@ class Filing(BaseModel):
         description: Brief description of filing content.
         url: URL to filing document.
     """
-    model_config = ConfigDict(populate_by_name=True)
-    
-    accession_number: str = Field(..., description="Unique filing identifier")
-    filing_date: str = Field(..., description="Filing date (ISO)")
-    form_type: str = Field(..., description="Form type (e.g., 10-K)")
-    primary_document: Optional[str] = Field(None, description="Primary document filename")
-    description: Optional[str] = Field(None, description="Filing description")
-    url: Optional[str] = Field(None, description="Document URL")
-    size_bytes: Optional[int] = Field(None, description="Document size in bytes")
+    accession_number: str
+    filing_date: str
+    form_type: str
+    primary_document: Optional[str] = None
+    description: Optional[str] = None
+    url: Optional[str] = None
+    size_bytes: Optional[int] = None
 
 
-class Executive(BaseModel):
+@dataclass(slots=True)
+class Executive:
     """Company executive information.
     
     Attributes:
@@ -91,17 +98,16 @@ class Executive(BaseModel):
         is_ceo: Whether this is the CEO.
         is_cfo: Whether this is the CFO.
     """
-    model_config = ConfigDict(populate_by_name=True)
-    
-    name: str = Field(..., description="Executive name")
-    title: str = Field(..., description="Job title")
-    compensation_usd: Optional[int] = Field(None, description="Annual compensation")
-    tenure_years: Optional[float] = Field(None, description="Years in role")
-    is_ceo: bool = Field(False, description="Is CEO")
-    is_cfo: bool = Field(False, description="Is CFO")
+    name: str
+    title: str
+    compensation_usd: Optional[int] = None
+    tenure_years: Optional[float] = None
+    is_ceo: bool = False
+    is_cfo: bool = False
 
 
-class RiskFactor(BaseModel):
+@dataclass(slots=True)
+class RiskFactor:
     """Risk factor disclosure from 10-K.
     
     Attributes:
@@ -110,15 +116,14 @@ class RiskFactor(BaseModel):
         severity: Risk severity level.
         raw_text: Original disclosure text.
     """
-    model_config = ConfigDict(populate_by_name=True)
-    
-    category: str = Field(..., description="Risk category")
-    summary: str = Field(..., description="Risk summary")
-    severity: str = Field("medium", description="Severity: high/medium/low")
-    raw_text: Optional[str] = Field(None, description="Original disclosure text")
+    category: str
+    summary: str
+    severity: str = "medium"
+    raw_text: Optional[str] = None
 
 
-class RecentEvent(BaseModel):
+@dataclass(slots=True)
+class RecentEvent:
     """Recent material event from 8-K filings.
     
     Attributes:
@@ -128,13 +133,11 @@ class RecentEvent(BaseModel):
         url: Filing URL.
         items: Specific 8-K item numbers triggered.
     """
-    model_config = ConfigDict(populate_by_name=True)
-    
-    date: str = Field(..., description="Event date (ISO)")
-    form_type: str = Field(default="8-K", description="Form type")
-    summary: Optional[str] = Field(None, description="Event summary")
-    url: Optional[str] = Field(None, description="Filing URL")
-    items: List[str] = Field(default_factory=list, description="8-K item numbers")
+    date: str
+    form_type: str = "8-K"
+    summary: Optional[str] = None
+    url: Optional[str] = None
+    items: List[str] = field(default_factory=list)
 
 
 class SECFilingsMetadata(BaseModel):
@@ -147,7 +150,7 @@ class SECFilingsMetadata(BaseModel):
         filing_count_8k: Number of 8-K filings available.
         last_filing_date: Date of most recent filing.
     """
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     
     recent_filings: List[Filing] = Field(default_factory=list)
     filing_count_10k: int = Field(0, description="10-K count")
@@ -156,7 +159,7 @@ class SECFilingsMetadata(BaseModel):
     last_filing_date: Optional[str] = Field(None, description="Last filing date")
 
 
-class SECEntityMetadata(BaseModel):
+class SECEntityMetadata(_TrustedModel):
     """SEC entity metadata from submissions endpoint.
     
     Attributes:
@@ -174,7 +177,7 @@ class SECEntityMetadata(BaseModel):
         state_of_incorporation: State of incorporation.
         phone: Contact phone number.
     """
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     
     cik: str = Field(..., description="CIK (10-digit)")
     entity_name: str = Field(..., description="Legal entity name")
@@ -191,7 +194,7 @@ class SECEntityMetadata(BaseModel):
     phone: Optional[str] = Field(None, description="Contact phone")
 
 
-class SECProfile(BaseModel):
+class SECProfile(_TrustedModel):
     """Complete SEC profile for a public company.
     
     Combines entity metadata, financial metrics, filings, and derived insights.
@@ -224,7 +227,7 @@ class SECProfile(BaseModel):
         enriched_at: When data was enriched.
         cache_expires_at: When cached data expires.
     """
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     
     # Identity
     cik: str = Field(..., description="CIK")
@@ -271,7 +274,7 @@ class SECProfile(BaseModel):
     cache_expires_at: Optional[datetime] = Field(None, description="Cache expiry")
 
 
-class EnrichedBrand(BaseModel):
+class EnrichedBrand(_TrustedModel):
     """Complete enriched brand profile combining mscan + SEC data.
     
     This is the top-level model that combines website scan data with
@@ -289,7 +292,7 @@ class EnrichedBrand(BaseModel):
         confidence_level: Data confidence level.
         data_completeness: Completeness ratio (0.0-1.0).
     """
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     
     # Original mscan data
     domain: str = Field(..., description="Website domain")
@@ -310,7 +313,8 @@ class EnrichedBrand(BaseModel):
     data_completeness: float = Field(0.0, ge=0.0, le=1.0, description="Data completeness")
 
 
-class EdgarAPIError(BaseModel):
+@dataclass(slots=True)
+class EdgarAPIError:
     """Error information from EDGAR API calls.
     
     Attributes:
@@ -320,16 +324,15 @@ class EdgarAPIError(BaseModel):
         url: API URL that caused the error.
         retryable: Whether the request can be retried.
     """
-    model_config = ConfigDict(populate_by_name=True)
-    
-    error_type: str = Field(..., description="Error type")
-    message: str = Field(..., description="Error message")
-    status_code: Optional[int] = Field(None, description="HTTP status code")
-    url: Optional[str] = Field(None, description="Request URL")
-    retryable: bool = Field(True, description="Is retryable")
+    error_type: str
+    message: str
+    status_code: Optional[int] = None
+    url: Optional[str] = None
+    retryable: bool = True
 
 
-class EnrichmentResult(BaseModel):
+@dataclass(slots=True)
+class EnrichmentResult:
     """Result of an enrichment operation.
     
     Contains either a successful profile or error information.
@@ -343,12 +346,10 @@ class EnrichmentResult(BaseModel):
         cache_hits: Number of cache hits.
         duration_seconds: Time taken for enrichment.
     """
-    model_config = ConfigDict(populate_by_name=True)
-    
-    success: bool = Field(..., description="Success flag")
-    brand: Optional[EnrichedBrand] = Field(None, description="Enriched brand")
-    error: Optional[EdgarAPIError] = Field(None, description="Error info")
-    raw_data: Optional[Dict[str, Any]] = Field(None, description="Raw API data")
-    api_calls_made: int = Field(0, description="API calls count")
-    cache_hits: int = Field(0, description="Cache hits count")
-    duration_seconds: Optional[float] = Field(None, description="Duration")
+    success: bool
+    brand: Optional[EnrichedBrand] = None
+    error: Optional[EdgarAPIError] = None
+    raw_data: Optional[Dict[str, Any]] = None
+    api_calls_made: int = 0
+    cache_hits: int = 0
+    duration_seconds: Optional[float] = None
@@ -1,7 +1,11 @@
 """Report generation for martech scan results."""
 
+import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
 from urllib.parse import urlparse
 
 from mscan.fingerprints import get_all_categories, load_vendors
@@ -12,6 +16,24 @@ COMPETITIVE_CATEGORIES = [
     'CTV',
 ]
 
+# How competitive categories are worded in takeaways, where that differs
+# from the category name
+_COMPETITIVE_LABELS = {
+    'Direct Mail': 'direct mail',
+    'CTV': 'CTV',
+}
+
+# First label of a plain http(s) host after an optional leading "www." (kept
+# case-sensitive to agree with the removeprefix fallback). Hosts that are
+# still "www." after stripping are left to the fallback.
+_BRAND_RE = re.compile(r'https?://(?-i:www\.)?(?!(?-i:www\.))([a-z0-9-]+)\.[a-z0-9.-]*(?:[/?#]|\Z)', re.IGNORECASE)
+
+# Spaces and dots in a brand name become dashes in the report filename
+_FILENAME_TRANS = str.maketrans({' ': '-', '.': '-'})
+
+# Reports are written line by line through one buffered binary handle
+_WRITE_BUFFER_SIZE = 128 * 1024
+
 
 def generate_report(
     scan_results: dict,
@@ -42,33 +64,65 @@ def generate_report(
 
     base_url = scan_results.get('base_url', '')
     brand_name = _extract_brand_name(base_url)
-    scan_date = datetime.now().strftime('%Y-%m-%d %H:%M')
+    now = datetime.now()
+    scan_date = now.strftime('%Y-%m-%d %H:%M')
     pages_scanned = scan_results.get('pages_scanned', [])
 
-    # Build report sections
+    # Report sections are generated line by line while the file is written;
+    # both vendor sections share one category grouping
+    by_category = _group_by_category(detected_vendors)
     header = _build_header(brand_name, base_url, scan_date, len(pages_scanned))
-    findings = _build_findings(detected_vendors)
-    takeaways = _build_takeaways(detected_vendors)
+    findings = _build_findings(detected_vendors, by_category)
+    takeaways = _build_takeaways(detected_vendors, by_category)
     unknown_table = _build_unknown_domains_table(unknown_domains)
 
-    report = f"{header}\n\n{findings}\n\n{takeaways}\n\n{unknown_table}"
-
     # Save report
-    safe_brand = brand_name.lower().replace(' ', '-').replace('.', '-')
-    filename = f"{safe_brand}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.txt"
+    safe_brand = brand_name.lower().translate(_FILENAME_TRANS)
+    filename = f"{safe_brand}-{now.strftime('%Y%m%d-%H%M%S')}.txt"
     report_path = output_dir / filename
 
-    with open(report_path, 'w') as f:
-        f.write(report)
+    # Sections are generated while writing, so write to a temporary file and
+    # only move it into place once the whole report has been written
+    tmp_path = report_path.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            _write_sections(f.write, (header, findings, takeaways, unknown_table))
+        os.replace(tmp_path, report_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     return str(report_path)
 
 
+def _write_sections(write, sections) -> None:
+    """
+    Write sections of lines as UTF-8, one blank line between sections.
+
+    Each line is encoded once and handed to a binary write, bypassing the
+    text layer's incremental encoder. There is no trailing newline.
+    """
+    separator = b''
+    for lines in sections:
+        for line in lines:
+            write(separator)
+            write(line.encode('utf-8'))
+            separator = b'\n'
+        separator = b'\n\n'
+
+
+@lru_cache(maxsize=512)
 def _extract_brand_name(url: str) -> str:
     """Extract brand name from URL."""
+    # Fast path for the usual http(s)://[www.]brand.tld[/...] shape; anything
+    # else (ports, credentials, bare hosts) goes through urlparse
+    m = _BRAND_RE.match(url)
+    if m:
+        return m.group(1).title()
+
     parsed = urlparse(url)
     domain = parsed.netloc or parsed.path
-    domain = domain.replace('www.', '')
+    domain = domain.removeprefix('www.')
 
     # Get the main part of the domain
     parts = domain.split('.')
@@ -78,165 +132,154 @@ def _extract_brand_name(url: str) -> str:
     return domain.title()
 
 
-def _build_header(brand_name: str, url: str, scan_date: str, pages_count: int) -> str:
+def _build_header(brand_name: str, url: str, scan_date: str, pages_count: int) -> Iterator[str]:
     """Build the report header section."""
     width = 60
     title = f"MARTECH SCAN: {brand_name.upper()}"
 
-    lines = [
-        "=" * width,
-        title.center(width),
-        "=" * width,
-        "",
-        f"  URL:          {url}",
-        f"  Scanned:      {scan_date}",
-        f"  Pages:        {pages_count}",
-    ]
-    return '\n'.join(lines)
+    yield "=" * width
+    yield title.center(width)
+    yield "=" * width
+    yield ""
+    yield f"  URL:          {url}"
+    yield f"  Scanned:      {scan_date}"
+    yield f"  Pages:        {pages_count}"
+
+
+def _group_by_category(detected_vendors: list[dict]) -> dict[str, list[str]]:
+    """
+    Group detected vendor names by category, keeping detection order.
+
+    The report only needs names and counts per category, so only the name
+    column is pulled out of the vendor dicts, once.
+    """
+    by_category = {}
+    for vendor in detected_vendors:
+        by_category.setdefault(vendor['category'], []).append(vendor['vendor_name'])
+    return by_category
 
 
-def _build_findings(detected_vendors: list[dict]) -> str:
+def _build_findings(detected_vendors: list[dict], by_category: dict[str, list[str]] = None) -> Iterator[str]:
     """Build the FINDINGS section mirroring terminal output."""
-    lines = ["FINDINGS"]
+    yield "FINDINGS"
 
     if not detected_vendors:
-        lines.append("  No martech vendors detected from the fingerprint database.")
-        lines.append("  Site may use unlisted vendors or block tracking scripts.")
-        return '\n'.join(lines)
+        yield "  No martech vendors detected from the fingerprint database."
+        yield "  Site may use unlisted vendors or block tracking scripts."
+        return
 
-    # Group by category
-    by_category = {}
-    for vendor in detected_vendors:
-        cat = vendor['category']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(vendor)
+    if by_category is None:
+        by_category = _group_by_category(detected_vendors)
 
-    # Get category order and totals
-    category_order = get_all_categories()
+    # Get category order and totals. Both are cached by the fingerprints
+    # module; loading the vendor list once keeps it to a single freshness check.
     all_vendors = load_vendors()
+    category_order = get_all_categories(all_vendors)
     total_in_db = len(all_vendors)
 
     # Show findings by category
     for cat in category_order:
-        if cat in by_category:
-            vendors = by_category[cat]
-            vendor_names = [v['vendor_name'] for v in vendors]
-            count = len(vendors)
-            lines.append(f"  {cat} ({count}): {', '.join(vendor_names)}")
+        vendor_names = by_category.get(cat)
+        if vendor_names is not None:
+            yield f"  {cat} ({len(vendor_names)}): {', '.join(vendor_names)}"
 
     # Stats line
-    lines.append("")
-    lines.append(f"  {len(by_category)}/{len(category_order)} categories - {len(detected_vendors)}/{total_in_db} vendors")
-
-    return '\n'.join(lines)
+    yield ""
+    yield f"  {len(by_category)}/{len(category_order)} categories - {len(detected_vendors)}/{total_in_db} vendors"
 
 
-def _build_takeaways(detected_vendors: list[dict]) -> str:
+def _build_takeaways(detected_vendors: list[dict], by_category: dict[str, list[str]] = None) -> Iterator[str]:
     """Build the TAKEAWAY section with actionable insights."""
-    lines = ["TAKEAWAY"]
+    yield "TAKEAWAY"
 
-    # Group by category
-    by_category = {}
-    for vendor in detected_vendors:
-        cat = vendor['category']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(vendor)
-
-    takeaways = []
-
-    # Check Direct Mail (competitive)
-    dm_cat = 'Direct Mail'
-    if dm_cat in by_category:
-        dm_vendors = [v['vendor_name'] for v in by_category[dm_cat]]
-        takeaways.append(f"[Competitor] Using {', '.join(dm_vendors)} for direct mail")
-    else:
-        takeaways.append("[Opportunity] No direct mail vendor - potential prospect")
-
-    # Check CTV (competitive)
-    ctv_cat = 'CTV'
-    if ctv_cat in by_category:
-        ctv_vendors = [v['vendor_name'] for v in by_category[ctv_cat]]
-        takeaways.append(f"[Competitor] Using {', '.join(ctv_vendors)} for CTV")
-    else:
-        takeaways.append("[Opportunity] No CTV vendor - potential prospect")
+    if by_category is None:
+        by_category = _group_by_category(detected_vendors)
+
+    # Competitive categories: name the competitor, or flag the opening
+    for cat in COMPETITIVE_CATEGORIES:
+        vendor_names = by_category.get(cat)
+        label = _COMPETITIVE_LABELS.get(cat, cat)
+        if vendor_names:
+            yield f"  [Competitor] Using {', '.join(vendor_names)} for {label}"
+        else:
+            yield f"  [Opportunity] No {label} vendor - potential prospect"
 
     # Social stack assessment
-    social_cat = 'Social Media'
-    if social_cat in by_category:
-        social_count = len(by_category[social_cat])
-        if social_count >= 3:
-            takeaways.append(f"[Insight] Heavy social presence ({social_count} platforms) - likely D2C brand")
+    social_count = len(by_category.get('Social Media', ()))
+    if social_count >= 3:
+        yield f"  [Insight] Heavy social presence ({social_count} platforms) - likely D2C brand"
 
     # Stack sophistication
-    if len(detected_vendors) == 0:
-        takeaways.append("[Warning] No detectable martech stack")
-    elif len(detected_vendors) <= 2:
-        takeaways.append("[Info] Basic martech stack - may be early-stage or privacy-focused")
-    elif len(detected_vendors) >= 8:
-        takeaways.append("[Insight] Sophisticated martech stack - mature marketing operation")
-
-    for takeaway in takeaways:
-        lines.append(f"  {takeaway}")
+    vendor_count = len(detected_vendors)
+    if vendor_count == 0:
+        yield "  [Warning] No detectable martech stack"
+    elif vendor_count <= 2:
+        yield "  [Info] Basic martech stack - may be early-stage or privacy-focused"
+    elif vendor_count >= 8:
+        yield "  [Insight] Sophisticated martech stack - mature marketing operation"
 
-    return '\n'.join(lines)
 
-
-def _build_unknown_domains_table(unknown_domains: list[dict]) -> str:
+def _build_unknown_domains_table(unknown_domains: list[dict]) -> Iterator[str]:
     """Build the UNKNOWN DOMAINS table with box-drawing characters."""
-    lines = ["UNKNOWN DOMAINS"]
+    yield "UNKNOWN DOMAINS"
 
     if not unknown_domains:
-        lines.append("  No unknown third-party domains detected.")
-        return '\n'.join(lines)
-
-    lines.append("")
+        yield "  No unknown third-party domains detected."
+        return
+
+    yield ""
+
+    # Calculate column widths based on content, in one pass that also
+    # formats the full-domains cells
+    max_domain = max_requests = max_full = 0
+    full_domain_strs = []
+    for d in unknown_domains:
+        full = _format_full_domains(d['full_domains'])
+        full_domain_strs.append(full)
+        domain_len = len(d['domain'])
+        if domain_len > max_domain:
+            max_domain = domain_len
+        requests_len = len(str(d['count']))
+        if requests_len > max_requests:
+            max_requests = requests_len
+        if len(full) > max_full:
+            max_full = len(full)
 
-    # Calculate column widths based on content
     col_num_width = max(3, len(str(len(unknown_domains))))
-    col_domain_width = max(20, max(len(d['domain']) for d in unknown_domains))
-    col_requests_width = max(8, max(len(str(d['count'])) for d in unknown_domains))
-
-    # Calculate full domains column - show up to 60 chars
-    def format_full_domains(full_domains: list[str]) -> str:
-        if len(full_domains) == 1:
-            return full_domains[0]
-        result = ', '.join(full_domains[:2])
-        if len(full_domains) > 2:
-            result += f" (+{len(full_domains) - 2})"
-        return result
-
-    full_domain_strs = [format_full_domains(d['full_domains']) for d in unknown_domains]
-    col_full_width = max(20, min(60, max(len(s) for s in full_domain_strs)))
-
-    # Build table
+    col_domain_width = max(20, max_domain)
+    col_requests_width = max(8, max_requests)
+    # Full domains column - show up to 60 chars
+    col_full_width = max(20, min(60, max_full))
+
+    # Build the border fills and the row template once; every row then
+    # costs a single str.format call
+    widths = (col_num_width, col_domain_width, col_requests_width, col_full_width)
+    heavy = ['━' * w for w in widths]
+    light = ['─' * w for w in widths]
+    row = f"│ {{:<{col_num_width}}} │ {{:<{col_domain_width}}} │ {{:>{col_requests_width}}} │ {{:<{col_full_width}}} │".format
+
     # Header row
-    top_border = f"┏━{'━' * col_num_width}━┳━{'━' * col_domain_width}━┳━{'━' * col_requests_width}━┳━{'━' * col_full_width}━┓"
-    header_row = f"┃ {'#':<{col_num_width}} ┃ {'Domain':<{col_domain_width}} ┃ {'Requests':>{col_requests_width}} ┃ {'Full Domains':<{col_full_width}} ┃"
-    header_sep = f"┡━{'━' * col_num_width}━╇━{'━' * col_domain_width}━╇━{'━' * col_requests_width}━╇━{'━' * col_full_width}━┩"
-
-    lines.append(top_border)
-    lines.append(header_row)
-    lines.append(header_sep)
-
-    # Data rows
-    for i, domain_info in enumerate(unknown_domains, 1):
-        domain = domain_info['domain']
-        requests = str(domain_info['count'])
-        full_domains_str = full_domain_strs[i - 1]
-
-        # Truncate if needed
-        if len(domain) > col_domain_width:
-            domain = domain[:col_domain_width - 3] + "..."
+    yield f"┏━{'━┳━'.join(heavy)}━┓"
+    yield f"┃ {'#':<{col_num_width}} ┃ {'Domain':<{col_domain_width}} ┃ {'Requests':>{col_requests_width}} ┃ {'Full Domains':<{col_full_width}} ┃"
+    yield f"┡━{'━╇━'.join(heavy)}━┩"
+
+    # Data rows. The domain and request columns are sized to their widest
+    # value, so only the full-domains cell can need truncating.
+    for i, (domain_info, full_domains_str) in enumerate(zip(unknown_domains, full_domain_strs), 1):
         if len(full_domains_str) > col_full_width:
             full_domains_str = full_domains_str[:col_full_width - 3] + "..."
 
-        row = f"│ {i:<{col_num_width}} │ {domain:<{col_domain_width}} │ {requests:>{col_requests_width}} │ {full_domains_str:<{col_full_width}} │"
-        lines.append(row)
+        yield row(i, domain_info['domain'], domain_info['count'], full_domains_str)
 
     # Bottom border
-    bottom_border = f"└─{'─' * col_num_width}─┴─{'─' * col_domain_width}─┴─{'─' * col_requests_width}─┴─{'─' * col_full_width}─┘"
-    lines.append(bottom_border)
+    yield f"└─{'─┴─'.join(light)}─┘"
+
 
-    return '\n'.join(lines)
+def _format_full_domains(full_domains: list[str]) -> str:
+    """Show the first two full domains of a group and how many more there are."""
+    if len(full_domains) == 1:
+        return full_domains[0]
+    result = ', '.join(full_domains[:2])
+    if len(full_domains) > 2:
+        result += f" (+{len(full_domains) - 2})"
+    return result
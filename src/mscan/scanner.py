@@ -1,36 +1,64 @@
 """Website scanning logic using Playwright."""
 
 import asyncio
+import heapq
+import re
+from operator import itemgetter
 from urllib.parse import urljoin, urlparse
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
-# Patterns that indicate a product page (retail sites)
-PRODUCT_PATTERNS = [
+# Patterns that indicate a product page (retail sites). A tuple, since the
+# scoring regex below is compiled from it once at import.
+PRODUCT_PATTERNS = (
     '/product/', '/products/',
     '/p/', '/item/', '/items/',
     '/dp/', '/gp/product/',  # Amazon-style
     '/shop/',  # if followed by more path segments
     '/buy/',
     '/sku/',
-]
+)
 
+# Browser tabs kept open for scanning; internal pages are scanned this many
+# at a time
+MAX_CONCURRENT_PAGES = 3
 
-def _score_product_likelihood(url: str) -> int:
-    """Score how likely a URL is to be a product page. Higher = more likely."""
-    score = 0
-    parsed = urlparse(url)
-    path = parsed.path.lower()
+
+# Stop waiting on a page once no new request has arrived for this long
+# (0 or None waits the full timeout)
+QUIET_SECONDS = 3
+
+# Font and audio/video URLs whose responses are never needed and are
+# aborted. The request is still seen (and recorded) before it is aborted.
+# Only these URLs are routed, so every other request goes straight to the
+# network without a round trip through Python. Images and stylesheets load
+# normally: tracking pixels are images, and the redirects they trigger
+# (cookie syncs) reveal further vendors.
+_BLOCKED_RESOURCE_GLOB = '**/*.{woff,woff2,ttf,otf,eot,mp4,webm,mp3,ogg,wav}'
+
+# Product patterns as one regex. The lookahead lets matches overlap (e.g.
+# /gp/product/ also contains /product/), and no two patterns can match at the
+# same position, so the distinct matches are exactly the patterns present.
+_PRODUCT_PATTERN_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, PRODUCT_PATTERNS)))
+_DIGIT_RE = re.compile(r'\d')
+
+
+def _score_product_likelihood(url: str, path: str = None) -> int:
+    """
+    Score how likely a URL is to be a product page. Higher = more likely.
+
+    Pass the URL's path if the caller has already parsed it.
+    """
+    if path is None:
+        path = urlparse(url).path
+    path = path.lower()
 
     # Check for product patterns
-    for pattern in PRODUCT_PATTERNS:
-        if pattern in path:
-            score += 10
+    score = 10 * len(set(_PRODUCT_PATTERN_RE.findall(path)))
 
     # URLs with long alphanumeric segments often are product pages
     # e.g., /p/ABC123-blue-widget or /products/mattress-purple-queen
-    segments = path.split('/')
-    for seg in segments:
-        if len(seg) > 5 and any(c.isdigit() for c in seg):
+    for seg in path.split('/'):
+        if len(seg) > 5 and _DIGIT_RE.search(seg):
             score += 5
         # Long slug-like segments with hyphens are often product names
         if len(seg) > 10 and '-' in seg:
@@ -39,16 +67,19 @@ def _score_product_likelihood(url: str) -> int:
     return score
 
 
-async def scan_website(url: str, timeout_seconds: int = 10, max_internal_pages: int = 3, headless: bool = False, system_browser: bool = False, status_callback=None) -> dict:
+async def scan_website(url: str, timeout_seconds: int = 10, max_internal_pages: int = 3, headless: bool = False, system_browser: bool = False, status_callback=None, quiet_seconds: int | None = QUIET_SECONDS) -> dict:
     """
     Scan a website and capture all network requests.
 
     Args:
         url: The URL to scan
-        timeout_seconds: How long to wait for network activity per page
+        timeout_seconds: Maximum seconds to wait for network activity per page
         max_internal_pages: Maximum number of internal pages to scan beyond homepage
         headless: Run in headless mode (may be blocked by bot detection)
         system_browser: Use system Chromium instead of bundled (bypasses some bot detection)
+        quiet_seconds: Stop waiting on a page early once no new request has
+            arrived for this many seconds. 0 or None always waits the full
+            timeout_seconds, for trackers that fire late
 
     Returns:
         Dictionary with scan results including all captured URLs and pages scanned
@@ -59,7 +90,8 @@ async def scan_website(url: str, timeout_seconds: int = 10, max_internal_pages:
 
     all_requests = set()
     pages_scanned = []
-    base_domain = urlparse(url).netloc.replace('www.', '')
+    parsed_url = urlparse(url)
+    base_domain = parsed_url.netloc.removeprefix('www.')
 
     status("Warming up the browser...")
 
@@ -124,41 +156,77 @@ async def scan_website(url: str, timeout_seconds: int = 10, max_internal_pages:
                 });
             """)
 
+        # Skip downloading fonts and audio/video; only request URLs matter
+        await context.route(_BLOCKED_RESOURCE_GLOB, _abort_route)
+
+        # A few tabs are opened once and reused for every page scan, instead
+        # of creating and tearing down a browser target per URL
+        tabs = asyncio.Queue()
+        for _ in range(max(1, min(MAX_CONCURRENT_PAGES, max_internal_pages))):
+            tabs.put_nowait(await context.new_page())
+
+        async def scan_in_tab(page_url, page_status):
+            page = await tabs.get()
+            try:
+                return await _scan_page(page, page_url, timeout_seconds, base_domain, page_status, quiet_seconds)
+            finally:
+                if not page.is_closed():
+                    # Unload the site so its timers and late requests stop
+                    # before the tab is handed to the next scan
+                    try:
+                        await page.goto('about:blank')
+                    except Exception:
+                        pass
+                if page.is_closed():
+                    # The tab crashed or was closed by the site; replace it
+                    page = await context.new_page()
+                tabs.put_nowait(page)
+
         # Scan homepage first
         status("Visiting homepage...")
-        homepage_requests, internal_links = await _scan_page(context, url, timeout_seconds, base_domain, status)
+        homepage_requests, internal_links = await scan_in_tab(url, status)
         all_requests.update(homepage_requests)
         pages_scanned.append(url)
 
         # Scan additional internal pages, prioritizing product pages
-        scanned_paths = {urlparse(url).path or '/'}
+        scanned_paths = {parsed_url.path or '/'}
 
-        # Score and sort links by product page likelihood
+        # Score and sort links by product page likelihood. Only the first
+        # link to each path is scored, so links that differ just by query
+        # string or fragment are neither rescored nor scanned twice.
         scored_links = []
-        for link in internal_links:
-            path = urlparse(link).path or '/'
-            if path not in scanned_paths:
-                score = _score_product_likelihood(link)
-                scored_links.append((score, link, path))
-
-        # Sort by score descending, take top candidates
-        scored_links.sort(key=lambda x: x[0], reverse=True)
-
-        pages_to_scan = []
-        for score, link, path in scored_links:
-            if len(pages_to_scan) >= max_internal_pages:
-                break
-            pages_to_scan.append(link)
+        for link, path in internal_links:
+            if path in scanned_paths:
+                continue
             scanned_paths.add(path)
-
-        for i, page_url in enumerate(pages_to_scan):
-            status(f"Exploring page {i + 2} of {len(pages_to_scan) + 1}...")
-            try:
-                page_requests, _ = await _scan_page(context, page_url, timeout_seconds, base_domain, status)
-                all_requests.update(page_requests)
-                pages_scanned.append(page_url)
-            except Exception:
-                pass  # Silently skip failed pages
+            score = _score_product_likelihood(link, path)
+            scored_links.append((score, link, path))
+
+        # Take the top candidates by score (ties keep link order)
+        top_links = heapq.nlargest(max_internal_pages, scored_links, key=itemgetter(0))
+        pages_to_scan = [link for _, link, _ in top_links]
+
+        # Internal pages load and idle concurrently, one per free tab;
+        # wall time is roughly one page's load + wait instead of the sum
+        total_pages = len(pages_to_scan) + 1
+
+        async def scan_internal(i, page_url):
+            def page_status(msg):
+                status(f"[page {i + 2}/{total_pages}] {msg}")
+
+            page_status("Exploring...")
+            page_requests, _ = await scan_in_tab(page_url, page_status)
+            return page_requests
+
+        results = await asyncio.gather(
+            *(scan_internal(i, page_url) for i, page_url in enumerate(pages_to_scan)),
+            return_exceptions=True,
+        )
+        for page_url, result in zip(pages_to_scan, results):
+            if isinstance(result, BaseException):
+                continue  # Silently skip failed pages
+            all_requests.update(result)
+            pages_scanned.append(page_url)
 
         await browser.close()
 
@@ -169,12 +237,53 @@ async def scan_website(url: str, timeout_seconds: int = 10, max_internal_pages:
     }
 
 
-async def _scan_page(context, url: str, timeout_seconds: int, base_domain: str, status_callback=None) -> tuple[set, list]:
+async def _abort_route(route):
+    """Abort a request for a resource the scan has no use for."""
+    await route.abort()
+
+
+async def _watch_requests(captured_requests: set, quiet: asyncio.Event, status, quiet_seconds: int | None = QUIET_SECONDS) -> None:
+    """
+    Report progress every second while a page settles.
+
+    Sets ``quiet`` once no new request has arrived for ``quiet_seconds``.
+    With 0 or None it never does, and runs until cancelled.
+    """
+    wait_messages = [
+        "Watching for sneaky trackers",
+        "Waiting for lazy scripts",
+        "Catching stragglers",
+        "Almost done with this page",
+    ]
+    last_count = -1
+    quiet_for = 0
+    i = 0
+    while True:
+        count = len(captured_requests)
+        if count == last_count:
+            quiet_for += 1
+            if quiet_seconds and quiet_for >= quiet_seconds:
+                quiet.set()
+                return
+        else:
+            last_count = count
+            quiet_for = 0
+        msg_idx = min(i // 3, len(wait_messages) - 1)  # Change message every 3 seconds
+        status(f"{wait_messages[msg_idx]}... ({count} requests)")
+        await asyncio.sleep(1)
+        i += 1
+
+
+async def _scan_page(page, url: str, timeout_seconds: int, base_domain: str, status_callback=None, quiet_seconds: int | None = QUIET_SECONDS) -> tuple[set, list]:
     """
     Scan a single page and return captured requests and internal links.
 
+    The page (browser tab) is borrowed from the caller and left open, so it
+    can be reused for the next URL.
+
     Returns:
-        Tuple of (set of request URLs, list of internal links)
+        Tuple of (set of request URLs, list of distinct internal
+        (link, path) pairs)
     """
     def status(msg):
         if status_callback:
@@ -183,11 +292,12 @@ async def _scan_page(context, url: str, timeout_seconds: int, base_domain: str,
     captured_requests = set()
     internal_links = []
 
-    page = await context.new_page()
+    # Capture all network requests. Full URLs are kept: vendor IDs are often
+    # only in the query string, so stripping it would lose matches.
+    capture = captured_requests.add
 
-    # Capture all network requests
     def handle_request(request):
-        captured_requests.add(request.url)
+        capture(request.url)
 
     page.on('request', handle_request)
 
@@ -201,30 +311,35 @@ async def _scan_page(context, url: str, timeout_seconds: int, base_domain: str,
             # Page took too long - continue anyway, we're capturing requests
             status("Page slow to respond... (continuing anyway)")
 
-        # Additional wait for lazy-loaded scripts with periodic status updates
-        wait_messages = [
-            "Watching for sneaky trackers",
-            "Waiting for lazy scripts",
-            "Catching stragglers",
-            "Almost done with this page",
-        ]
-        for i in range(timeout_seconds):
-            msg_idx = min(i // 3, len(wait_messages) - 1)  # Change message every 3 seconds
-            status(f"{wait_messages[msg_idx]}... ({len(captured_requests)} requests)")
-            await asyncio.sleep(1)
+        # Additional wait for lazy-loaded scripts. A ticker reports progress
+        # and ends the wait early once the page has gone quiet.
+        quiet = asyncio.Event()
+        ticker = asyncio.create_task(_watch_requests(captured_requests, quiet, status, quiet_seconds))
+        try:
+            await asyncio.wait_for(quiet.wait(), timeout_seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            ticker.cancel()
 
         status("Cataloging the surveillance...")
-        # Extract internal links for further scanning
-        links = await page.evaluate('''() => {
-            const links = Array.from(document.querySelectorAll('a[href]'));
-            return links.map(a => a.href).filter(href => href.startsWith('http'));
-        }''')
-
-        # Filter to same-domain links
-        for link in links:
-            link_domain = urlparse(link).netloc.replace('www.', '')
-            if link_domain == base_domain:
-                internal_links.append(link)
+        # Extract distinct same-domain links for further scanning. Filtering
+        # in the page means only internal links cross back to Python, already
+        # split into (href, path).
+        internal_links = await page.evaluate('''(baseDomain) => {
+            const seen = new Set();
+            const out = [];
+            for (const a of document.querySelectorAll('a[href]')) {
+                const href = a.href;
+                if (!href.startsWith('http') || seen.has(href)) continue;
+                seen.add(href);
+                let u;
+                try { u = new URL(href); } catch (e) { continue; }
+                if (u.host.replace(/^www\\./, '') !== baseDomain) continue;
+                out.push([href, u.pathname || '/']);
+            }
+            return out;
+        }''', base_domain)
 
     except PlaywrightTimeout:
         # Already handled above, but just in case
@@ -233,11 +348,11 @@ async def _scan_page(context, url: str, timeout_seconds: int, base_domain: str,
         # Silently handle other errors - we still got requests
         pass
     finally:
-        await page.close()
+        page.remove_listener('request', handle_request)
 
     return captured_requests, internal_links
 
 
-def scan_website_sync(url: str, timeout_seconds: int = 10, max_internal_pages: int = 3, headless: bool = False, system_browser: bool = False, status_callback=None) -> dict:
+def scan_website_sync(url: str, timeout_seconds: int = 10, max_internal_pages: int = 3, headless: bool = False, system_browser: bool = False, status_callback=None, quiet_seconds: int | None = QUIET_SECONDS) -> dict:
     """Synchronous wrapper for scan_website."""
-    return asyncio.run(scan_website(url, timeout_seconds, max_internal_pages, headless, system_browser, status_callback))
+    return asyncio.run(scan_website(url, timeout_seconds, max_internal_pages, headless, system_browser, status_callback, quiet_seconds))
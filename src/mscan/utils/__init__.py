@@ -1,5 +1,5 @@
 """Utility modules for mscan."""
 
-from mscan.utils.rate_limiter import RateLimiter, AdaptiveRateLimiter, RateLimitStats
+from mscan.utils.rate_limiter import RateLimiter, AdaptiveRateLimiter, ShardedRateLimiter, RateLimitStats
 
-__all__ = ['RateLimiter', 'AdaptiveRateLimiter', 'RateLimitStats']
+__all__ = ['RateLimiter', 'AdaptiveRateLimiter', 'ShardedRateLimiter', 'RateLimitStats']
@@ -5,12 +5,13 @@ maximum request rates per time window. Designed for SEC EDGAR API compliance
 (10 requests per second maximum).
 """
 
-import time
+import itertools
 import logging
-from collections import deque
-from threading import Lock
+import os
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +30,16 @@ class RateLimiter:
     """Token bucket rate limiter for controlling API request rates.
     
     This implementation uses a token bucket algorithm that allows bursts
-    up to the max_requests limit, then enforces the rate limit. It's
-    thread-safe and suitable for concurrent API clients.
+    up to the max_requests limit, then enforces the rate limit. Tokens
+    refill continuously at max_requests / window_seconds per second. It's
+    thread-safe and suitable for concurrent API clients: the lock is only
+    held for the refill arithmetic, never while sleeping.
     
     Args:
         max_requests: Maximum number of requests allowed per window.
         window_seconds: Time window in seconds for the rate limit.
+        clock: Monotonic time source in seconds. Defaults to time.monotonic;
+            tests can pass a manual clock instead of patching time.
         
     Example:
         >>> limiter = RateLimiter(max_requests=10, window_seconds=1)
@@ -46,7 +51,15 @@ class RateLimiter:
         window_seconds: The configured time window in seconds.
     """
     
-    def __init__(self, max_requests: int = 10, window_seconds: int = 1):
+    # Fixed attribute layout: the whole bucket state is a handful of slots
+    __slots__ = ('max_requests', 'window_seconds', '_clock', '_zero_time', '_cond', '_stats', '_delay_us')
+    
+    def __init__(
+        self,
+        max_requests: int = 10,
+        window_seconds: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
         if max_requests <= 0:
             raise ValueError("max_requests must be positive")
         if window_seconds <= 0:
@@ -54,12 +67,20 @@ class RateLimiter:
             
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests = deque()
-        self._lock = Lock()
+        self._clock = clock
+        # The bucket is stored as the instant it was (or will be) empty: it
+        # holds (now - _zero_time) * rate tokens, capped at max_requests. One
+        # float replaces a token count plus refill timestamp, and refilling is
+        # implicit in the clock. Starting a full window back means full.
+        self._zero_time = clock() - window_seconds
+        self._cond = threading.Condition()
         self._stats = RateLimitStats()
+        # Time spent waiting, in whole microseconds: integer sums stay exact
+        # however many waits are added, unlike a running float
+        self._delay_us = 0
         
         logger.debug(
-            f"RateLimiter initialized: {max_requests} requests per {window_seconds}s"
+            "RateLimiter initialized: %s requests per %ss", max_requests, window_seconds
         )
     
     def acquire(self, block: bool = True, timeout: Optional[float] = None) -> bool:
@@ -78,27 +99,59 @@ class RateLimiter:
         Raises:
             TimeoutError: If timeout is reached while waiting for a slot.
         """
-        start_time = time.time()
+        return self.acquire_n(1, block, timeout)
+    
+    def acquire_n(self, n: int, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Acquire ``n`` request slots at once, all or nothing.
+        
+        For callers that know their budget up front (e.g. a batch of
+        lookups): the lock is taken once and, when blocking, the wait lands
+        when all ``n`` slots are free rather than sleeping once per slot.
+        
+        Args:
+            n: Number of slots, from 1 to max_requests.
+            block: If True, block until the slots are available. If False,
+                   return immediately with success/failure status.
+            timeout: Maximum time to wait in seconds. Only used if block=True.
+                    None means wait indefinitely.
+                    
+        Returns:
+            True if the slots were acquired, False if non-blocking and the
+            rate limit would be exceeded.
+            
+        Raises:
+            ValueError: If n is not between 1 and max_requests.
+            TimeoutError: If timeout is reached while waiting for the slots.
+        """
+        start_time = self._clock()
+        delayed = False
         
-        with self._lock:
+        with self._cond:
             while True:
-                now = time.time()
+                if not 1 <= n <= self.max_requests:
+                    raise ValueError(f"n must be between 1 and max_requests ({self.max_requests})")
                 
-                # Remove expired timestamps outside the window
-                cutoff = now - self.window_seconds
-                while self._requests and self._requests[0] < cutoff:
-                    self._requests.popleft()
+                now = self._clock()
+                # Seconds of refill the slots cost; they are available once the
+                # (full-clamped) empty instant is at least that far back
+                needed = min(n * self.window_seconds / self.max_requests, self.window_seconds)
+                zero_time = max(self._zero_time, now - self.window_seconds)
                 
                 # Check if we can proceed
-                if len(self._requests) < self.max_requests:
-                    self._requests.append(now)
-                    self._stats.total_requests += 1
-                    self._stats.last_request_time = now
-                    self._stats.current_bucket_size = len(self._requests)
+                if now - zero_time >= needed:
+                    self._zero_time = zero_time + needed
+                    stats = self._stats
+                    stats.total_requests += n
+                    # Wall-clock time, for reporting; the bucket uses _clock
+                    stats.last_request_time = time.time()
                     
-                    logger.debug(
-                        f"Rate limit slot acquired. Bucket: {len(self._requests)}/{self.max_requests}"
-                    )
+                    # Bucket size is derived on demand (get_stats), so the
+                    # common path only pays for it when debug logging is on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Rate limit slot acquired. Bucket: %d/%d",
+                            self._used_slots(now), self.max_requests
+                        )
                     return True
                 
                 # Rate limit would be exceeded
@@ -106,8 +159,8 @@ class RateLimiter:
                     logger.debug("Rate limit would be exceeded (non-blocking mode)")
                     return False
                 
-                # Calculate wait time
-                sleep_time = self._requests[0] - cutoff
+                # Calculate wait time until enough tokens refill
+                sleep_time = zero_time + needed - now
                 
                 # Check timeout
                 if timeout is not None:
@@ -119,18 +172,61 @@ class RateLimiter:
                         )
                     sleep_time = min(sleep_time, remaining)
                 
-                self._stats.delayed_requests += 1
+                if not delayed:
+                    self._stats.delayed_requests += 1
+                    delayed = True
                 
-                # Release lock while sleeping to allow other threads
-                self._lock.release()
-                try:
-                    logger.debug(f"Rate limit hit, sleeping for {sleep_time:.3f}s")
-                    time.sleep(max(0, sleep_time))
-                    self._stats.total_delay_seconds += sleep_time
-                finally:
-                    self._lock.acquire()
+                # Waiting releases the lock so other threads can proceed, and
+                # returns early if reset() or a rate change notifies waiters
+                logger.debug("Rate limit hit, sleeping for %.3fs", sleep_time)
+                self._cond.wait(max(0, sleep_time))
+                self._delay_us += round((self._clock() - now) * 1_000_000)
                 
-                # Loop continues to recheck with lock held
+                # Loop continues to recheck under the lock
+    
+    def try_acquire(self, n: int = 1) -> tuple[bool, float]:
+        """Try to acquire ``n`` slots without blocking.
+        
+        Args:
+            n: Number of slots, from 1 to max_requests.
+            
+        Returns:
+            (acquired, retry_after): retry_after is 0.0 on success, otherwise
+            the seconds until ``n`` slots will be free.
+            
+        Raises:
+            ValueError: If n is not between 1 and max_requests.
+        """
+        with self._cond:
+            if self.acquire_n(n, block=False):
+                return True, 0.0
+            needed = min(n * self.window_seconds / self.max_requests, self.window_seconds)
+            now = self._clock()
+            zero_time = max(self._zero_time, now - self.window_seconds)
+            return False, max(0.0, zero_time + needed - now)
+    
+    @property
+    def _rate(self) -> float:
+        """Token refill rate in tokens per second."""
+        return self.max_requests / self.window_seconds
+    
+    def _tokens(self, now: float) -> float:
+        """Tokens in the bucket at ``now``."""
+        return min(float(self.max_requests), (now - self._zero_time) * self._rate)
+    
+    def _used_slots(self, now: float) -> int:
+        """Number of slots consumed and not yet refilled."""
+        return max(0, int(self.max_requests - self._tokens(now)))
+    
+    def _set_max_requests(self, max_requests: int, now: float):
+        """Change the limit, keeping the tokens currently in the bucket.
+        
+        The token count is derived from the rate, so the empty instant is
+        moved to match the new rate. Caller must hold the lock.
+        """
+        tokens = min(float(max_requests), self._tokens(now))
+        self.max_requests = max_requests
+        self._zero_time = now - tokens / self._rate
     
     def get_stats(self) -> RateLimitStats:
         """Get current rate limiter statistics.
@@ -138,19 +234,14 @@ class RateLimiter:
         Returns:
             RateLimitStats object with current metrics.
         """
-        with self._lock:
-            # Update current bucket size
-            now = time.time()
-            cutoff = now - self.window_seconds
-            while self._requests and self._requests[0] < cutoff:
-                self._requests.popleft()
-            
-            self._stats.current_bucket_size = len(self._requests)
+        with self._cond:
+            # Snapshot the counters together; the bucket size is computed
+            # for now without writing it back
             return RateLimitStats(
                 total_requests=self._stats.total_requests,
                 delayed_requests=self._stats.delayed_requests,
-                total_delay_seconds=self._stats.total_delay_seconds,
-                current_bucket_size=self._stats.current_bucket_size,
+                total_delay_seconds=self._delay_us / 1_000_000,
+                current_bucket_size=self._used_slots(self._clock()),
                 last_request_time=self._stats.last_request_time
             )
     
@@ -160,44 +251,40 @@ class RateLimiter:
         Clears all tracked requests and statistics. Useful for testing
         or when switching to a different API context.
         """
-        with self._lock:
-            self._requests.clear()
+        with self._cond:
+            self._zero_time = self._clock() - self.window_seconds
             self._stats = RateLimitStats()
+            self._delay_us = 0
+            self._cond.notify_all()
             logger.debug("RateLimiter reset")
     
     def current_rate(self) -> float:
         """Calculate current request rate over the window.
         
+        Lock-free: the bucket is read once, so this never waits behind
+        acquire() and may lag a concurrent acquire by one request.
+        
         Returns:
             Requests per second over the current window.
         """
-        with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
-            
-            # Count requests in current window
-            count = sum(1 for t in self._requests if t >= cutoff)
-            return count / self.window_seconds if self.window_seconds > 0 else 0.0
+        zero_time = self._zero_time
+        max_requests = self.max_requests
+        tokens = min(max_requests, (self._clock() - zero_time) * max_requests / self.window_seconds)
+        # Consumed tokens not yet refilled, spread over the window
+        return (max_requests - tokens) / self.window_seconds
     
     def time_until_next_slot(self) -> float:
         """Estimate time until the next request slot will be available.
         
+        Lock-free, like current_rate().
+        
         Returns:
             Seconds until a slot is available. 0.0 if a slot is available now.
         """
-        with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
-            
-            # Clean expired
-            while self._requests and self._requests[0] < cutoff:
-                self._requests.popleft()
-            
-            if len(self._requests) < self.max_requests:
-                return 0.0
-            
-            # Time until oldest request expires
-            return max(0.0, self._requests[0] - cutoff)
+        zero_time = self._zero_time
+        interval = self.window_seconds / self.max_requests
+        # Time until the next token refills
+        return max(0.0, zero_time + interval - self._clock())
 
 
 class AdaptiveRateLimiter(RateLimiter):
@@ -213,17 +300,24 @@ class AdaptiveRateLimiter(RateLimiter):
         min_requests: Minimum requests per window (floor for backoff).
         backoff_factor: Factor to multiply by on rate limit error.
         recovery_rate: How quickly to restore rate after success (0-1).
+        clock: Monotonic time source in seconds (see RateLimiter).
     """
     
+    __slots__ = (
+        '_initial_max', '_min_requests', '_backoff_factor', '_recovery_rate',
+        '_consecutive_successes',
+    )
+    
     def __init__(
         self,
         max_requests: int = 10,
         window_seconds: int = 1,
         min_requests: int = 1,
         backoff_factor: float = 0.5,
-        recovery_rate: float = 0.1
+        recovery_rate: float = 0.1,
+        clock: Callable[[], float] = time.monotonic
     ):
-        super().__init__(max_requests, window_seconds)
+        super().__init__(max_requests, window_seconds, clock)
         self._initial_max = max_requests
         self._min_requests = min_requests
         self._backoff_factor = backoff_factor
@@ -239,15 +333,17 @@ class AdaptiveRateLimiter(RateLimiter):
         
         # Recovery every N successes
         if self._consecutive_successes >= 10:
-            with self._lock:
+            with self._cond:
                 current = self.max_requests
                 new_limit = min(
                     self._initial_max,
                     int(current + (self._initial_max - current) * self._recovery_rate) + 1
                 )
                 if new_limit != current:
-                    self.max_requests = new_limit
-                    logger.info(f"Rate limit recovered to {new_limit} req/s")
+                    self._set_max_requests(new_limit, self._clock())
+                    # Tokens now refill faster; let waiters recompute
+                    self._cond.notify_all()
+                    logger.info("Rate limit recovered to %d req/s", new_limit)
             self._consecutive_successes = 0
     
     def record_rate_limit_error(self):
@@ -257,7 +353,7 @@ class AdaptiveRateLimiter(RateLimiter):
         """
         self._consecutive_successes = 0
         
-        with self._lock:
+        with self._cond:
             current = self.max_requests
             new_limit = max(
                 self._min_requests,
@@ -266,7 +362,145 @@ class AdaptiveRateLimiter(RateLimiter):
             if new_limit < current:
                 self.max_requests = new_limit
                 logger.warning(
-                    f"Rate limit hit, backing off to {new_limit} req/s"
+                    "Rate limit hit, backing off to %d req/s", new_limit
                 )
-                # Clear request history to allow immediate retry at lower rate
-                self._requests.clear()
+                # Refill the bucket to allow immediate retry at lower rate
+                self._zero_time = self._clock() - self.window_seconds
+                self._cond.notify_all()
+
+
+class ShardedRateLimiter:
+    """Rate limiter split into independent per-thread token buckets.
+    
+    With many threads calling acquire() on one RateLimiter, they all
+    contend on its lock. Here the limit is divided across ``shards`` buckets
+    and each thread is pinned (round-robin, on first use) to one of them, so
+    threads on different shards never touch the same lock.
+    
+    The split is soft: the shards' limits add up to max_requests, so the
+    overall rate never exceeds it, but a thread can only use its own shard's
+    share. If threads are unevenly busy, the idle shards' capacity goes
+    unused. Prefer a plain RateLimiter unless lock contention is measurable.
+    
+    Each shard is an AdaptiveRateLimiter. acquire, acquire_n, try_acquire
+    and record_success act on the calling thread's shard. A 429/503 means
+    the server's limit for the whole client was exceeded, so
+    record_rate_limit_error backs off every shard at once; each shard then
+    recovers as its own thread records successes.
+    
+    Args:
+        max_requests: Maximum number of requests allowed per window, across
+            all shards.
+        window_seconds: Time window in seconds for the rate limit.
+        shards: Number of buckets. Defaults to the CPU count, and is capped at
+            max_requests so every shard allows at least one request.
+        clock: Monotonic time source in seconds (see RateLimiter).
+    """
+    
+    def __init__(
+        self,
+        max_requests: int = 10,
+        window_seconds: int = 1,
+        shards: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_requests <= 0:
+            raise ValueError("max_requests must be positive")
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if shards <= 0:
+            raise ValueError("shards must be positive")
+        shards = min(shards, max_requests)
+        
+        self.window_seconds = window_seconds
+        # Spread the limit as evenly as whole requests allow
+        base, extra = divmod(max_requests, shards)
+        self._shards = [
+            AdaptiveRateLimiter(base + (i < extra), window_seconds, clock=clock)
+            for i in range(shards)
+        ]
+        self._next_shard = itertools.count()
+        self._local = threading.local()
+    
+    @property
+    def max_requests(self) -> int:
+        """Current requests per window, summed across shards."""
+        return sum(shard.max_requests for shard in self._shards)
+    
+    def _shard(self) -> AdaptiveRateLimiter:
+        """The bucket assigned to the calling thread."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._shards[next(self._next_shard) % len(self._shards)]
+            self._local.shard = shard
+            return shard
+    
+    def acquire(self, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Acquire a request slot from the calling thread's shard.
+        
+        See RateLimiter.acquire.
+        """
+        return self._shard().acquire(block, timeout)
+    
+    def acquire_n(self, n: int, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Acquire ``n`` slots at once from the calling thread's shard.
+        
+        ``n`` may not exceed that shard's max_requests. See
+        RateLimiter.acquire_n.
+        """
+        return self._shard().acquire_n(n, block, timeout)
+    
+    def try_acquire(self, n: int = 1) -> tuple[bool, float]:
+        """Try to acquire ``n`` slots from the calling thread's shard.
+        
+        See RateLimiter.try_acquire.
+        """
+        return self._shard().try_acquire(n)
+    
+    def record_success(self):
+        """Record a successful response against the calling thread's shard.
+        
+        See AdaptiveRateLimiter.record_success.
+        """
+        self._shard().record_success()
+    
+    def record_rate_limit_error(self):
+        """Back off every shard after a 429/503 response.
+        
+        See AdaptiveRateLimiter.record_rate_limit_error.
+        """
+        for shard in self._shards:
+            shard.record_rate_limit_error()
+    
+    def time_until_next_slot(self) -> float:
+        """Seconds until the calling thread's shard has a slot free."""
+        return self._shard().time_until_next_slot()
+    
+    def current_rate(self) -> float:
+        """Requests per second over the current window, across all shards."""
+        return sum(shard.current_rate() for shard in self._shards)
+    
+    def get_stats(self) -> RateLimitStats:
+        """Get statistics summed across all shards.
+        
+        Returns:
+            RateLimitStats object with current metrics.
+        """
+        stats = RateLimitStats()
+        for shard_stats in map(RateLimiter.get_stats, self._shards):
+            stats.total_requests += shard_stats.total_requests
+            stats.delayed_requests += shard_stats.delayed_requests
+            stats.total_delay_seconds += shard_stats.total_delay_seconds
+            stats.current_bucket_size += shard_stats.current_bucket_size
+            if shard_stats.last_request_time is not None and (
+                stats.last_request_time is None
+                or shard_stats.last_request_time > stats.last_request_time
+            ):
+                stats.last_request_time = shard_stats.last_request_time
+        return stats
+    
+    def reset(self):
+        """Reset every shard's state and statistics."""
+        for shard in self._shards:
+            shard.reset()
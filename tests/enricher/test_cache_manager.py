@@ -2,6 +2,7 @@
 
 import json
 import time
+import threading
 import tempfile
 import shutil
 from pathlib import Path
@@ -41,6 +42,71 @@ class TestCacheManager:
         result = cache.get("test_key")
         assert result == data
         
+    def test_memory_cache_skips_database(self, cache):
+        """Test that repeat hits are served from the in-memory LRU."""
+        cache.set("key", {"data": 1})
+        first = cache.get("key")
+        
+        with cache._get_connection() as conn:
+            conn.execute("DELETE FROM edgar_cache")
+        
+        # Same decoded object, without touching SQLite
+        assert cache.get("key") is first
+        
+    def test_memory_cache_is_bounded(self, temp_db):
+        """Test that the in-memory LRU evicts least recently used entries."""
+        cache = CacheManager(db_path=temp_db, memory_size=2)
+        cache.set("key1", {"data": 1})
+        cache.set("key2", {"data": 2})
+        cache.get("key1")
+        cache.set("key3", {"data": 3})
+        
+        assert list(cache._memory) == ["key1", "key3"]
+        assert cache.get("key2") == {"data": 2}
+        
+    def test_delete_drops_memory_entry(self, cache):
+        """Test that deleted entries are not served from memory."""
+        cache.set("key", {"data": 1})
+        cache.get("key")
+        
+        assert cache.delete("key") is True
+        assert cache.get("key") is None
+        
+    def test_uses_wal_journal(self, cache):
+        """Test that the database is opened in WAL mode."""
+        with cache._get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        
+    def test_connection_reused_until_closed(self, cache):
+        """Test that calls share one connection and close() reopens lazily."""
+        with cache._get_connection() as first:
+            pass
+        cache.set("key", {"data": 1})
+        with cache._get_connection() as conn:
+            assert conn is first
+        
+        cache.close()
+        assert cache.set("key", {"data": 2}) is True
+        with cache._get_connection() as conn:
+            assert conn is not first
+        
+    def test_shared_connection_across_threads(self, cache):
+        """Test that worker threads can use the shared connection."""
+        def worker(n):
+            for i in range(20):
+                cache.set(f"key{n}-{i}", {"data": i})
+                
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert cache.get_stats().errors == 0
+        with cache._get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM edgar_cache").fetchone()[0] == 80
+        
     def test_get_nonexistent(self, cache):
         """Test getting a non-existent key."""
         result = cache.get("nonexistent_key")
@@ -224,8 +290,6 @@ class TestCacheManager:
         
     def test_concurrent_access(self, cache):
         """Test concurrent access to cache."""
-        import threading
-        
         errors = []
         
         def worker(thread_id):
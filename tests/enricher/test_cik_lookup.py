@@ -241,6 +241,24 @@ class TestCIKLookup:
         assert lookup._loaded is True
         assert "AAPL" in lookup._ticker_to_cik
         
+    @responses.activate
+    def test_ensure_loaded_fetches_once(self, temp_dir):
+        """Test that ensure_loaded loads the mapping and is a no-op after."""
+        responses.add(
+            responses.GET,
+            "https://www.sec.gov/files/company_tickers.json",
+            json={"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}},
+            status=200
+        )
+        
+        db_path = Path(temp_dir) / "cache.db"
+        lookup = CIKLookup(CacheManager(db_path=str(db_path)), RateLimiter(), "TestAgent test@test.com")
+        
+        assert lookup.ensure_loaded() is True
+        assert lookup.ensure_loaded() is True
+        assert lookup.get_stats()['loaded'] is True
+        assert len(responses.calls) == 1
+        
     @responses.activate  
     def test_load_mapping_failure(self, temp_dir):
         """Test handling of mapping load failure."""
@@ -1,6 +1,7 @@
 """Basic integration tests for the EDGAR client."""
 
 import pytest
+import requests
 import responses
 
 from mscan.enricher.edgar_client import (
@@ -24,6 +25,12 @@ class TestEdgarClient:
         with pytest.raises(ValueError, match="must include contact email"):
             EdgarClient(user_agent="CompanyName")
             
+    @pytest.mark.parametrize("user_agent", ["contact@company.com", "Company contact@", "Company @company.com"])
+    def test_init_rejects_malformed_user_agent(self, user_agent):
+        """Test that the user agent must be a name followed by a valid email."""
+        with pytest.raises(ValueError, match="must include contact email"):
+            EdgarClient(user_agent=user_agent)
+            
     def test_init_success(self):
         """Test successful initialization."""
         client = EdgarClient(user_agent="TestCo test@test.com")
@@ -214,3 +221,156 @@ class TestEdgarClient:
         # Check YoY growth calculation
         assert metrics.revenue_growth_yoy is not None
         assert metrics.revenue_growth_yoy > 0  # Should show growth
+        
+    @responses.activate
+    def test_get_company_facts_projects_tags(self, tmp_path):
+        """Test that company facts are reduced to the needed tags."""
+        client = EdgarClient(user_agent="TestCo test@test.com", cache_dir=str(tmp_path))
+        
+        responses.add(
+            responses.GET,
+            "https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json",
+            json={
+                "cik": 320193,
+                "entityName": "Apple Inc.",
+                "facts": {
+                    "us-gaap": {
+                        "Revenues": {"units": {"USD": []}},
+                        "AccountsPayableCurrent": {"units": {"USD": []}}
+                    },
+                    "dei": {
+                        "EntityNumberOfEmployees": {"units": {"shares": []}},
+                        "EntityCommonStockSharesOutstanding": {"units": {"shares": []}}
+                    }
+                }
+            },
+            status=200
+        )
+        
+        facts = client.get_company_facts("320193")
+        
+        assert facts["entityName"] == "Apple Inc."
+        assert set(facts["facts"]["us-gaap"]) == {"Revenues"}
+        assert set(facts["facts"]["dei"]) == {"EntityNumberOfEmployees"}
+        
+        # The slim projection is what gets cached
+        assert client.cache.get("facts:0000320193") == facts
+        
+    @responses.activate
+    def test_enrich_batch_preserves_order(self, tmp_path):
+        """Test batch enrichment returns one result per ticker, in order."""
+        client = EdgarClient(user_agent="TestCo test@test.com", cache_dir=str(tmp_path))
+        
+        responses.add(
+            responses.GET,
+            "https://www.sec.gov/files/company_tickers.json",
+            json={"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "https://data.sec.gov/submissions/CIK0000320193.json",
+            json={"cik": "0000320193", "entityName": "Apple Inc.", "tickers": ["AAPL"]},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json",
+            status=404
+        )
+        
+        results = client.enrich_batch(["FAKE", "AAPL", "NOPE"])
+        
+        assert [r.success for r in results] == [False, True, False]
+        assert results[0].error.error_type == "ticker_not_found"
+        assert results[1].brand.sec_profile.ticker == "AAPL"
+        
+    def test_enrich_batch_empty(self):
+        """Test batch enrichment with no tickers."""
+        client = EdgarClient(user_agent="TestCo test@test.com")
+        
+        assert client.enrich_batch([]) == []
+        
+    @responses.activate
+    def test_enrich_by_ticker_memoizes_result(self, tmp_path):
+        """Test that repeat ticker enrichments are served from the result cache."""
+        client = EdgarClient(user_agent="TestCo test@test.com", cache_dir=str(tmp_path))
+        
+        responses.add(
+            responses.GET,
+            "https://www.sec.gov/files/company_tickers.json",
+            json={"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "https://data.sec.gov/submissions/CIK0000320193.json",
+            json={"cik": "0000320193", "entityName": "Apple Inc.", "tickers": ["AAPL"]},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json",
+            status=404
+        )
+        
+        first = client.enrich_by_ticker("AAPL")
+        first.brand.domain = "apple.com"
+        calls = len(responses.calls)
+        
+        second = client.enrich_by_ticker("aapl")
+        
+        assert second.success is True
+        assert len(responses.calls) == calls
+        # Mutating one result must not leak into the next
+        assert second.brand.domain == ""
+        # Counters describe the cached call, not the original one
+        assert first.api_calls_made > 0
+        assert second.api_calls_made == 0
+        
+    @responses.activate
+    def test_result_cache_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        """Test that the result cache is bounded and evicts in LRU order."""
+        from mscan.enricher import edgar_client
+        monkeypatch.setattr(edgar_client, "_RESULT_CACHE_SIZE", 2)
+        client = EdgarClient(user_agent="TestCo test@test.com", cache_dir=str(tmp_path))
+        
+        tickers = {"AAPL": 320193, "MSFT": 789019, "NKE": 320187}
+        responses.add(
+            responses.GET,
+            "https://www.sec.gov/files/company_tickers.json",
+            json={str(i): {"cik_str": cik, "ticker": t, "title": t}
+                  for i, (t, cik) in enumerate(tickers.items())},
+            status=200
+        )
+        for ticker, cik in tickers.items():
+            responses.add(
+                responses.GET,
+                f"https://data.sec.gov/submissions/CIK{cik:010d}.json",
+                json={"cik": f"{cik:010d}", "entityName": ticker, "tickers": [ticker]},
+                status=200
+            )
+            responses.add(
+                responses.GET,
+                f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik:010d}.json",
+                status=404
+            )
+        
+        client.enrich_by_ticker("AAPL")
+        client.enrich_by_ticker("MSFT")
+        client.enrich_by_ticker("AAPL")  # AAPL is now most recently used
+        client.enrich_by_ticker("NKE")
+        
+        assert list(client._result_cache) == ["AAPL", "NKE"]
+        
+    def test_with_shared_session(self, tmp_path):
+        """Test that clients built from one session share it with the CIK lookup."""
+        session = requests.Session()
+        session.headers["User-Agent"] = "TestCo test@test.com"
+        
+        first = EdgarClient.with_shared_session(session, cache_dir=str(tmp_path / "a"))
+        second = EdgarClient.with_shared_session(session, cache_dir=str(tmp_path / "b"))
+        
+        assert first.session is second.session is session
+        assert first.cik_lookup.session is session
+        assert first.user_agent == "TestCo test@test.com"
@@ -22,6 +22,7 @@ class TestProfileBuilder:
         builder = ProfileBuilder()
         assert builder.min_revenue_threshold == 0
         assert builder.min_employee_threshold == 0
+        assert not hasattr(builder, "__dict__")
     
     def test_init_custom_values(self):
         """Test initialization with custom values."""
@@ -128,6 +129,40 @@ class TestProfileBuilder:
             score = builder._calculate_qualification_score(sec_profile, [])
             assert score >= min_expected_score, f"Revenue ${revenue} should score at least {min_expected_score}"
     
+    def test_calculate_qualification_score_subclass_tiers(self):
+        """Test that a subclass overriding a tier table is scored with it."""
+        class CustomBuilder(ProfileBuilder):
+            EMPLOYEE_TIERS = ((50, 7),)
+        
+        financials = FinancialMetrics(employee_count=60)
+        sec_profile = SECProfile(
+            cik="0000000000",
+            company_name="Test",
+            latest_financials=financials,
+            enriched_at=datetime.now()
+        )
+        
+        assert CustomBuilder()._calculate_qualification_score(sec_profile, []) == 7
+        assert ProfileBuilder()._calculate_qualification_score(sec_profile, []) == 0
+    
+    def test_revenue_tiers_in_usd_and_billions(self):
+        """Test that REVENUE_TIERS stays in USD and overrides carry to billions."""
+        assert ProfileBuilder.REVENUE_TIERS[0] == (1_000_000_000_000, 100)
+        assert ProfileBuilder.REVENUE_TIERS_B[0] == (1000, 100)
+        
+        class CustomBuilder(ProfileBuilder):
+            REVENUE_TIERS = ((2_000_000_000, 33),)
+        
+        assert CustomBuilder.REVENUE_TIERS_B == ((2, 33),)
+        financials = FinancialMetrics(revenue_usd=3_000_000_000)
+        sec_profile = SECProfile(
+            cik="0000000000",
+            company_name="Test",
+            latest_financials=financials,
+            enriched_at=datetime.now()
+        )
+        assert CustomBuilder()._calculate_qualification_score(sec_profile, []) == 33
+    
     def test_calculate_qualification_score_employee_tiers(self):
         """Test qualification scoring based on employee tiers."""
         builder = ProfileBuilder()
@@ -495,6 +530,35 @@ class TestProfileBuilder:
         assert brand.sec_profile.company_name == "Apple Inc"
         assert brand.qualification_score > 0
     
+    def test_build_profile_from_enrichment_keeps_existing_scoring(self):
+        """Test that an already-scored brand is not rescored without scan data."""
+        builder = ProfileBuilder()
+        
+        enrichment_result = EnrichmentResult(
+            success=True,
+            brand=EnrichedBrand(
+                domain="",
+                sec_profile=SECProfile(
+                    cik="0000320193",
+                    company_name="Apple Inc",
+                    latest_financials=FinancialMetrics(revenue_usd=391_000_000_000),
+                    enriched_at=datetime.now()
+                ),
+                qualification_score=42,
+                insights=["Precomputed insight"]
+            )
+        )
+        
+        brand = builder.build_profile_from_enrichment("apple.com", enrichment_result)
+        assert brand.qualification_score == 42
+        assert brand.insights == ["Precomputed insight"]
+        
+        brand = builder.build_profile_from_enrichment(
+            "apple.com", enrichment_result, scan_data={"vendors": []}
+        )
+        assert brand.qualification_score != 42
+        assert brand.insights != ["Precomputed insight"]
+    
     def test_build_profile_from_enrichment_failure(self):
         """Test building profile from failed enrichment result."""
         builder = ProfileBuilder()
@@ -540,3 +604,24 @@ class TestProfileBuilder:
         assert len(brand.detected_technologies) == 2
         assert brand.detected_technologies[0]["vendor"] == "Google Analytics"
         assert brand.detected_technologies[0]["category"] == "Analytics"
+    
+    def test_build_profiles_parallel(self):
+        """Test building profiles in worker processes preserves order."""
+        builder = ProfileBuilder()
+        sec_profile = SECProfile(
+            cik="0000320193",
+            company_name="Apple Inc",
+            latest_financials=FinancialMetrics(revenue_usd=391_000_000_000),
+            enriched_at=datetime.now()
+        )
+        
+        brands = builder.build_profiles_parallel(
+            [("a.com", None, None), ("b.com", {}, sec_profile)],
+            workers=2
+        )
+        
+        assert [b.domain for b in brands] == ["a.com", "b.com"]
+        assert brands[1].is_publicly_traded is True
+        assert brands[1].qualification_score == builder.build_profile(
+            "b.com", sec_profile=sec_profile
+        ).qualification_score
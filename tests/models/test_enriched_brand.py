@@ -180,6 +180,23 @@ class TestSECProfile:
         
         assert profile2.cik == profile.cik
         assert profile2.latest_financials.revenue_usd == 1000000
+        
+    def test_from_trusted(self):
+        """Test building from already-validated data."""
+        profile = SECProfile(
+            cik="0000320193",
+            company_name="Apple Inc.",
+            latest_financials=FinancialMetrics(revenue_usd=1000000)
+        )
+        
+        trusted = SECProfile.from_trusted(
+            cik=profile.cik,
+            company_name=profile.company_name,
+            latest_financials=profile.latest_financials
+        )
+        
+        assert trusted == profile
+        assert trusted.insider_activity == "neutral"  # Defaults still applied
 
 
 class TestEnrichedBrand:
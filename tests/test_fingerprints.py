@@ -0,0 +1,161 @@
+"""Tests for vendor fingerprint matching."""
+
+import json
+import os
+
+import pytest
+
+from mscan.fingerprints import (
+    find_unknown_domains,
+    get_all_categories,
+    get_base_domain,
+    load_vendors,
+    match_vendors,
+    match_vendors_extended,
+    scan_requests,
+)
+
+
+def _vendor(name, domains, url_patterns=(), category='Analytics'):
+    return {
+        'vendor_name': name,
+        'category': category,
+        'detection_rules': {'domains': list(domains), 'url_patterns': list(url_patterns)},
+    }
+
+
+VENDORS = [
+    _vendor('Twitter', ['t.co']),
+    _vendor('Meta Pixel', ['facebook.com/tr'], ['id='], category='Social Media'),
+    _vendor('Example Tag', ['tags.example-vendor.com']),
+]
+
+
+def _names(detected):
+    return [v['vendor_name'] for v in detected]
+
+
+class TestMatchVendors:
+    """Test cases for match_vendors."""
+
+    def test_plain_domain_respects_host_boundary(self):
+        """Test that t.co matches its subdomains but not microsoft.co."""
+        assert _names(match_vendors(['https://t.co/abc'], VENDORS)) == ['Twitter']
+        assert _names(match_vendors(['https://ads.t.co/abc'], VENDORS)) == ['Twitter']
+        assert match_vendors(['https://microsoft.co/abc'], VENDORS) == []
+
+    def test_path_rule_matches_subdomain(self):
+        """Test that facebook.com/tr matches on www. and extracts the ID."""
+        detected = match_vendors(['https://www.facebook.com/tr?id=12345&ev=PageView'], VENDORS)
+
+        assert _names(detected) == ['Meta Pixel']
+        assert detected[0]['matching_domains'] == ['facebook.com/tr']
+        assert detected[0]['details'] == 'id=12345'
+
+    @pytest.mark.parametrize('url', [
+        'https://notfacebook.com/tr?id=1',
+        'https://facebook.com.evil.io/tr?id=1',
+        'https://example.com/?next=facebook.com/tr',
+        'https://www.facebook.com/about/tr',
+    ])
+    def test_path_rule_respects_host_boundary(self, url):
+        """Test that path rules do not match lookalike hosts or other paths."""
+        assert match_vendors([url], VENDORS) == []
+
+    def test_userinfo_and_port_are_ignored(self):
+        """Test that credentials and ports do not hide the request host."""
+        detected = match_vendors(['https://user:pw@tags.example-vendor.com:443/v1.js'], VENDORS)
+        assert _names(detected) == ['Example Tag']
+
+        detected = match_vendors(['https://user:pw@www.facebook.com:443/tr?id=9'], VENDORS)
+        assert _names(detected) == ['Meta Pixel']
+
+    def test_list_changed_in_place_is_reindexed(self):
+        """Test that editing a caller's vendor list between calls takes effect."""
+        vendors = [dict(v) for v in VENDORS]
+        url = 'https://cdn.new-vendor.io/p.js'
+        assert match_vendors([url], vendors) == []
+
+        vendors.append(_vendor('New Vendor', ['new-vendor.io']))
+        assert _names(match_vendors([url], vendors)) == ['New Vendor']
+
+
+class TestGetBaseDomain:
+    """Test cases for get_base_domain."""
+
+    @pytest.mark.parametrize('host,expected', [
+        ('a.b.example.co.uk', 'example.co.uk'),
+        ('cdn.shop.example.com', 'example.com'),
+        ('example.com', 'example.com'),
+        ('co.uk', 'co.uk'),
+        ('localhost', 'localhost'),
+    ])
+    def test_registrable_domain(self, host, expected):
+        assert get_base_domain(host) == expected
+
+
+class TestScanRequests:
+    """Test cases for scan_requests."""
+
+    REQUESTS = [
+        'https://www.facebook.com/tr?id=1',
+        'https://js.widget-one.io/a.js',
+        'https://js.widget-one.io/a.js',
+        'https://api.widget-one.io/b',
+        'https://js.widget-one.io/a.js',
+        'https://other-thing.co.uk/x',
+        'https://www.shop.com/home',
+    ]
+
+    def test_matches_separate_passes(self):
+        """Test that the combined scan agrees with the individual functions."""
+        result = scan_requests(self.REQUESTS, 'shop.com', VENDORS)
+
+        assert result['vendors'] == match_vendors_extended(self.REQUESTS, VENDORS)
+        assert result['unknown'] == find_unknown_domains(self.REQUESTS, 'shop.com', VENDORS)
+
+    def test_unknown_counts_and_samples(self):
+        """Test that repeat requests count but sample URLs are distinct."""
+        unknown = scan_requests(self.REQUESTS, 'shop.com', VENDORS)['unknown']
+
+        assert [u['domain'] for u in unknown] == ['widget-one.io', 'other-thing.co.uk']
+        widget = unknown[0]
+        assert widget['count'] == 4
+        assert sorted(widget['full_domains']) == ['api.widget-one.io', 'js.widget-one.io']
+        assert widget['sample_urls'] == ['https://js.widget-one.io/a.js', 'https://api.widget-one.io/b']
+        assert unknown[1]['count'] == 1
+
+
+class TestLoadVendors:
+    """Test cases for load_vendors."""
+
+    def test_cached_until_file_changes(self, tmp_path):
+        """Test that a rewrite with the same mtime but a new size is reloaded."""
+        path = tmp_path / 'vendors.json'
+        path.write_text(json.dumps({'vendors': VENDORS[:1]}))
+        stat = path.stat()
+
+        first = load_vendors(str(path))
+        assert isinstance(first, tuple)
+        assert load_vendors(str(path)) is first
+
+        path.write_text(json.dumps({'vendors': VENDORS}))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert _names(load_vendors(str(path))) == _names(VENDORS)
+
+
+class TestGetAllCategories:
+    """Test cases for get_all_categories."""
+
+    def test_preferred_order_then_alphabetical(self):
+        vendors = VENDORS + [_vendor('Zeta', ['zeta.io'], category='Zzz'), _vendor('Mail', ['m.io'], category='Direct Mail')]
+        assert get_all_categories(vendors) == ['Direct Mail', 'Social Media', 'Analytics', 'Zzz']
+
+    def test_list_changed_in_place_is_recounted(self):
+        """Test that a category added to a caller's list shows up."""
+        vendors = list(VENDORS)
+        assert 'CTV' not in get_all_categories(vendors)
+
+        vendors.append(_vendor('Streamer', ['stream.tv'], category='CTV'))
+        assert 'CTV' in get_all_categories(vendors)
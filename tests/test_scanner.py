@@ -0,0 +1,65 @@
+"""Tests for the page-settling watcher in the scanner."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('playwright')
+
+from mscan.scanner import _watch_requests
+
+
+def _watch(captured, quiet_seconds, run_for, add_at=None):
+    """Run _watch_requests for up to ``run_for`` seconds.
+
+    Returns (quiet event set, elapsed seconds, status messages). If
+    ``add_at`` is given, a request is captured that many seconds in.
+    """
+    statuses = []
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        quiet = asyncio.Event()
+        watcher = asyncio.create_task(_watch_requests(captured, quiet, statuses.append, quiet_seconds))
+        if add_at is not None:
+            loop.call_later(add_at, captured.add, 'https://late.example.com/tag.js')
+        start = loop.time()
+        try:
+            await asyncio.wait_for(quiet.wait(), run_for)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            watcher.cancel()
+        return quiet.is_set(), loop.time() - start
+
+    is_quiet, elapsed = asyncio.run(run())
+    return is_quiet, elapsed, statuses
+
+
+class TestWatchRequests:
+    """Test cases for _watch_requests."""
+
+    def test_sets_quiet_when_requests_stop(self):
+        """Test that the watcher ends the wait once the page goes quiet."""
+        is_quiet, elapsed, statuses = _watch({'https://a.example.com/'}, 1, run_for=5)
+
+        assert is_quiet
+        assert elapsed < 2
+        assert statuses == ['Watching for sneaky trackers... (1 requests)']
+
+    def test_new_request_restarts_quiet_window(self):
+        """Test that a request arriving mid-window delays the quiet exit."""
+        is_quiet, elapsed, statuses = _watch({'https://a.example.com/'}, 1, run_for=5, add_at=0.5)
+
+        assert is_quiet
+        assert elapsed >= 1.5
+        assert statuses[-1] == 'Watching for sneaky trackers... (2 requests)'
+
+    @pytest.mark.parametrize('quiet_seconds', [0, None])
+    def test_zero_or_none_waits_full_timeout(self, quiet_seconds):
+        """Test that disabling the quiet window keeps watching until cancelled."""
+        is_quiet, elapsed, statuses = _watch({'https://a.example.com/'}, quiet_seconds, run_for=1.5)
+
+        assert not is_quiet
+        assert elapsed >= 1.5
+        assert len(statuses) == 2
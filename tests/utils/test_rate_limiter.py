@@ -4,7 +4,7 @@ import time
 import threading
 import pytest
 
-from mscan.utils.rate_limiter import RateLimiter, AdaptiveRateLimiter, RateLimitStats
+from mscan.utils.rate_limiter import RateLimiter, AdaptiveRateLimiter, ShardedRateLimiter, RateLimitStats
 
 
 class TestRateLimiter:
@@ -111,6 +111,87 @@ class TestRateLimiter:
         wait_time = limiter.time_until_next_slot()
         assert wait_time > 0
         
+    def test_tokens_refill_over_time(self):
+        """Test that tokens refill continuously at the configured rate."""
+        limiter = RateLimiter(max_requests=2, window_seconds=0.2)
+        
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is False
+        
+        # One token refills every 0.1s
+        assert 0 < limiter.time_until_next_slot() <= 0.1
+        time.sleep(0.11)
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is False
+        
+    def test_reset_wakes_waiters(self):
+        """Test that reset() wakes a blocked acquire early."""
+        limiter = RateLimiter(max_requests=1, window_seconds=10)
+        limiter.acquire()
+        
+        waiter = threading.Thread(target=limiter.acquire)
+        start = time.monotonic()
+        waiter.start()
+        time.sleep(0.05)
+        limiter.reset()
+        waiter.join(timeout=2)
+        
+        assert not waiter.is_alive()
+        assert time.monotonic() - start < 2
+        assert limiter.get_stats().total_requests == 1
+        
+    def test_manual_clock(self):
+        """Test that refills follow an injected clock."""
+        now = [100.0]
+        limiter = RateLimiter(max_requests=2, window_seconds=1, clock=lambda: now[0])
+        
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is False
+        assert limiter.time_until_next_slot() == pytest.approx(0.5)
+        
+        now[0] += 0.5
+        assert limiter.time_until_next_slot() == 0.0
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is False
+        
+        # Idle time never fills the bucket past max_requests
+        now[0] += 60
+        assert limiter.current_rate() == 0.0
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is False
+        
+    def test_acquire_n(self):
+        """Test acquiring several slots at once."""
+        now = [0.0]
+        limiter = RateLimiter(max_requests=4, window_seconds=1, clock=lambda: now[0])
+        
+        assert limiter.acquire_n(3, block=False) is True
+        # All or nothing: two slots are not available, so none is taken
+        assert limiter.acquire_n(2, block=False) is False
+        assert limiter.acquire(block=False) is True
+        assert limiter.get_stats().total_requests == 4
+        
+        with pytest.raises(ValueError):
+            limiter.acquire_n(5)
+        with pytest.raises(ValueError):
+            limiter.acquire_n(0)
+            
+    def test_try_acquire(self):
+        """Test non-blocking acquire with a retry hint."""
+        now = [0.0]
+        limiter = RateLimiter(max_requests=4, window_seconds=1, clock=lambda: now[0])
+        
+        assert limiter.try_acquire(4) == (True, 0.0)
+        ok, retry_after = limiter.try_acquire(2)
+        assert ok is False
+        assert retry_after == pytest.approx(0.5)
+        
+        now[0] += retry_after
+        assert limiter.try_acquire(2) == (True, 0.0)
+        
     def test_thread_safety(self):
         """Test thread safety with concurrent requests."""
         limiter = RateLimiter(max_requests=100, window_seconds=1)
@@ -176,3 +257,97 @@ class TestAdaptiveRateLimiter:
         # Should have backed off
         assert limiter.max_requests < 10
         assert limiter.max_requests >= 2
+
+
+class TestShardedRateLimiter:
+    """Test cases for ShardedRateLimiter."""
+    
+    def test_limit_split_across_shards(self):
+        """Test that shard limits add up to max_requests."""
+        limiter = ShardedRateLimiter(max_requests=10, window_seconds=1, shards=4)
+        assert [shard.max_requests for shard in limiter._shards] == [3, 3, 2, 2]
+        
+        # Never more shards than requests
+        limiter = ShardedRateLimiter(max_requests=2, shards=8)
+        assert len(limiter._shards) == 2
+        
+    def test_init_invalid_values(self):
+        """Test initialization with invalid values."""
+        with pytest.raises(ValueError, match="max_requests must be positive"):
+            ShardedRateLimiter(max_requests=0)
+        with pytest.raises(ValueError, match="shards must be positive"):
+            ShardedRateLimiter(shards=0)
+            
+    def test_thread_uses_own_shard(self):
+        """Test that each thread draws from its own shard."""
+        limiter = ShardedRateLimiter(max_requests=4, window_seconds=10, shards=2)
+        
+        # This thread's shard allows 2 requests
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is True
+        assert limiter.acquire(block=False) is False
+        
+        # Another thread gets the other shard
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(limiter.acquire(block=False) for _ in range(3))
+        )
+        worker.start()
+        worker.join()
+        assert results == [True, True, False]
+        
+    def test_batch_and_try_acquire_use_own_shard(self):
+        """Test acquire_n and try_acquire against the calling thread's shard."""
+        limiter = ShardedRateLimiter(max_requests=4, window_seconds=10, shards=2)
+        
+        assert limiter.acquire_n(2, block=False) is True
+        acquired, retry_after = limiter.try_acquire()
+        assert acquired is False
+        assert retry_after > 0
+        with pytest.raises(ValueError):
+            limiter.acquire_n(3, block=False)
+        
+        # The other shard is untouched
+        results = []
+        worker = threading.Thread(target=lambda: results.append(limiter.try_acquire(2)))
+        worker.start()
+        worker.join()
+        assert results == [(True, 0.0)]
+        
+    def test_rate_limit_error_backs_off_every_shard(self):
+        """Test that a rate-limit error slows all shards and success recovers one."""
+        limiter = ShardedRateLimiter(max_requests=20, window_seconds=1, shards=2)
+        assert limiter.max_requests == 20
+        
+        # Reported from another thread, it still applies to this thread's shard
+        worker = threading.Thread(target=limiter.record_rate_limit_error)
+        worker.start()
+        worker.join()
+        assert [shard.max_requests for shard in limiter._shards] == [5, 5]
+        assert limiter.max_requests == 10
+        
+        for _ in range(10):
+            limiter.record_success()
+        assert sorted(shard.max_requests for shard in limiter._shards) == [5, 6]
+        
+    def test_get_stats_and_reset(self):
+        """Test that stats are summed across shards and reset clears them."""
+        limiter = ShardedRateLimiter(max_requests=10, window_seconds=1, shards=2)
+        
+        def make_requests():
+            for _ in range(3):
+                limiter.acquire(block=False)
+                
+        threads = [threading.Thread(target=make_requests) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+            
+        stats = limiter.get_stats()
+        assert stats.total_requests == 6
+        assert stats.last_request_time is not None
+        assert limiter.current_rate() > 0
+        
+        limiter.reset()
+        assert limiter.get_stats().total_requests == 0